@@ -62,8 +62,11 @@ def create_app(config: Optional[Config] = None) -> Flask:
     )
 
     # サービスの初期化
-    app.ollama_service = OllamaService(base_url=config.OLLAMA_URL)
-    app.voicevox_service = VoiceVoxService(base_url=config.VOICEVOX_URL)
+    app.ollama_service = OllamaService(
+        base_url=config.OLLAMA_URL,
+        semantic_cache_threshold=getattr(config, "SCRIPT_SEMANTIC_CACHE_THRESHOLD", None),
+    )
+    VoiceVoxService(base_url=config.VOICEVOX_URL).init_app(app)
     app.audio_manager = AudioManager()
 
     # エラーハンドラの登録
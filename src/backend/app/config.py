@@ -1,10 +1,19 @@
 """Configuration settings for the backend application."""
 
 import os
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
 
+def _optional_float(value: Optional[str]) -> Optional[float]:
+    """環境変数の値を浮動小数点数に変換する（未設定・空文字・不正な値はNone）"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
 class BaseConfig(BaseModel):
     """ベース設定モデル"""
 
@@ -21,6 +30,10 @@ class BaseConfig(BaseModel):
         default_factory=lambda: os.getenv("OLLAMA_MODEL", "phi"),
         description="OllamaのデフォルトモデルID",
     )
+    SCRIPT_SEMANTIC_CACHE_THRESHOLD: Optional[float] = Field(
+        default_factory=lambda: _optional_float(os.getenv("SCRIPT_SEMANTIC_CACHE_THRESHOLD")),
+        description="表記の近いトピックの台本を再利用するコサイン類似度のしきい値（未設定で無効）",
+    )
     AUDIO_OUTPUT_DIR: str = Field(
         default_factory=lambda: os.getenv("AUDIO_OUTPUT_DIR", "./audio"),
         description="音声ファイル出力ディレクトリ",
@@ -1,8 +1,17 @@
 import logging
+import platform
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Deque, Iterator, Optional, Tuple
 
-from flask import Blueprint, current_app, jsonify, request
+import psutil
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
 
+from src.backend.app.models.script import ScriptLine
+from src.backend.app.utils import json_utils
 from src.backend.app.utils.error_handlers import APIError, api_error_handler
 from src.backend.app.utils.prompt_loader import PromptLoader
 
@@ -14,6 +23,42 @@ logger = logging.getLogger(__name__)
 
 prompt_loader = PromptLoader()
 
+# ヘルスチェックの応答本文（毎回同じなので起動時にエンコードしておく）
+_HEALTHY_BODY = json_utils.dumps({"status": "healthy"})
+
+# 詳細ステータスをキャッシュする秒数（監視ツールの短い間隔のポーリングをまとめる）
+_STATUS_TTL = 2.0
+_status_lock = threading.Lock()
+# 詳細ステータス取得時に各サービスへの問い合わせを並行させるためのワーカー
+_status_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="status")
+
+# 実行中に変わらないシステム情報は起動時に一度だけ取得する
+_PLATFORM = platform.platform()
+_PYTHON_VERSION = platform.python_version()
+_CPU_COUNT = psutil.cpu_count()
+
+# メモリ・ディスク使用量を取得し直すまでの最小間隔（秒）
+_PSUTIL_SAMPLE_INTERVAL = 1.0
+# 最後に取得した (取得時刻, virtual_memory, disk_usage)
+_psutil_cache: Optional[Tuple[float, Any, Any]] = None
+
+
+def _psutil_sample() -> Tuple[Any, Any]:
+    """メモリとディスクの使用量を取得
+
+    前回の取得から _PSUTIL_SAMPLE_INTERVAL 秒以内の場合は前回の値を返す。
+
+    Returns:
+        Tuple[Any, Any]: psutil.virtual_memory() と psutil.disk_usage("/") の結果
+    """
+    global _psutil_cache
+    now = time.monotonic()
+    cached = _psutil_cache
+    if cached is None or now - cached[0] >= _PSUTIL_SAMPLE_INTERVAL:
+        cached = (now, psutil.virtual_memory(), psutil.disk_usage("/"))
+        _psutil_cache = cached
+    return cached[1], cached[2]
+
 
 @api_bp.route("/health", methods=["GET"])
 @api_error_handler
@@ -24,39 +69,28 @@ def health_check():
     Returns:
         dict: ヘルスステータス情報
     """
-    return jsonify({"status": "healthy"})
+    return current_app.response_class(_HEALTHY_BODY, mimetype="application/json")
 
 
-@api_bp.route("/detailed-status", methods=["GET"])
-@api_error_handler
-def detailed_status():
-    """
-    詳細なサービスステータス情報を返すエンドポイント
+def _compute_status() -> bytes:
+    """サービスとシステムのステータス情報を収集してJSONにエンコード
 
     Returns:
-        Response: 詳細なシステムステータス情報
+        bytes: ステータス情報のJSONバイト列
     """
-    # Ollamaの詳細情報を取得
-    ollama_service = current_app.ollama_service
-    ollama_detail = ollama_service.get_detailed_status()
-
-    # VoiceVoxのステータスも取得
-    voicevox_service = current_app.voicevox_service
-    voicevox_detail = voicevox_service.get_detailed_status()
+    # VoiceVoxのステータス取得をワーカーで開始し、その間にOllamaの詳細情報を取得する
+    voicevox_future = _status_executor.submit(current_app.voicevox_service.get_detailed_status)
+    ollama_detail = current_app.ollama_service.get_detailed_status()
+    voicevox_detail = voicevox_future.result()
 
     # システム情報の取得
-    import platform
-
-    import psutil
-
-    # diskusageの処理を修正
-    disk = psutil.disk_usage("/")
+    memory, disk = _psutil_sample()
     system_info = {
-        "platform": platform.platform(),
-        "python_version": platform.python_version(),
-        "cpu_count": psutil.cpu_count(),
-        "memory_total": psutil.virtual_memory().total,
-        "memory_available": psutil.virtual_memory().available,
+        "platform": _PLATFORM,
+        "python_version": _PYTHON_VERSION,
+        "cpu_count": _CPU_COUNT,
+        "memory_total": memory.total,
+        "memory_available": memory.available,
         "disk_usage": {
             "total": disk.total,
             "used": disk.used,
@@ -73,7 +107,31 @@ def detailed_status():
         "system": system_info,
     }
 
-    return jsonify(response_data)
+    return json_utils.dumps(response_data)
+
+
+@api_bp.route("/detailed-status", methods=["GET"])
+@api_error_handler
+def detailed_status():
+    """
+    詳細なサービスステータス情報を返すエンドポイント
+
+    結果はアプリケーションごとに _STATUS_TTL 秒間キャッシュされる。
+    クエリパラメータ force=1 を指定するとキャッシュを使わずに取得し直す。
+
+    Returns:
+        Response: 詳細なシステムステータス情報
+    """
+    force = request.args.get("force") == "1"
+    # 同時に来たポーリングが重複してバックエンドに問い合わせないよう、取得はロック内で行う
+    with _status_lock:
+        cached = current_app.extensions.get("status_cache")
+        now = time.monotonic()
+        if force or cached is None or now - cached[0] >= _STATUS_TTL:
+            cached = (now, _compute_status())
+            current_app.extensions["status_cache"] = cached
+
+    return current_app.response_class(cached[1], mimetype="application/json")
 
 
 @api_bp.route("/prompts", methods=["GET"])
@@ -131,6 +189,17 @@ def register_model():
         return jsonify({"error": str(e)}), 500
 
 
+def _speaker_id(line: ScriptLine) -> int:
+    """台本の行の役割に対応するVoiceVoxの話者IDを返す"""
+    return 1 if line.role.value == "tsukkomi" else 2
+
+
+def _sse(payload: Any, event: Optional[str] = None) -> bytes:
+    """Server-Sent Events の1イベント分のバイト列を作成"""
+    data = b"data: " + json_utils.dumps(payload) + b"\n\n"
+    return f"event: {event}\n".encode() + data if event else data
+
+
 @api_bp.route("/generate", methods=["POST"])
 @api_error_handler
 def generate():
@@ -167,15 +236,19 @@ def generate():
 
     try:
         # スクリプト生成
-        script_lines = ollama_service.generate_manzai_script(topic, model)
+        # no_cache が指定された場合は生成済みの台本を使わずに生成し直す
+        script_lines = ollama_service.generate_manzai_script(
+            topic, model, use_cache=not data.get("no_cache")
+        )
 
-        # 音声合成とスクリプト構築
-        script_dict = []
-        for i, line in enumerate(script_lines):
-            speaker_id = 1 if line.role.value == "tsukkomi" else 2
-            audio_bytes = voicevox_service.synthesize_voice(line.text, speaker_id)
+        # 各行の音声合成を並行して行い、結果は台本の順序で受け取る
+        audio_results = voicevox_service.synthesize_many(
+            [(line.text, _speaker_id(line)) for line in script_lines]
+        )
 
-            # 音声ファイル保存
+        # 音声ファイル保存とスクリプト構築
+        script_dict = []
+        for i, (line, audio_bytes) in enumerate(zip(script_lines, audio_results)):
             audio_filename = audio_manager.save_audio(audio_bytes, f"script_{i}")
 
             script_dict.append(
@@ -189,6 +262,91 @@ def generate():
         raise APIError(f"Failed to generate script: {e!s}", 500)
 
 
+@api_bp.route("/generate-stream", methods=["POST"])
+@api_error_handler
+def generate_stream():
+    """漫才スクリプトを生成しながら、音声付きの行をServer-Sent Eventsで順に返す
+
+    台本の各行は生成された時点で音声合成を開始するため、LLMの生成と
+    VoiceVoxの音声合成が重なって進む。行は台本の順序で送られ、最後に
+    done イベント、途中で失敗した場合は error イベントが送られる。
+    """
+    data = request.get_json(silent=True) or {}
+    topic = str(data.get("topic", "")).strip()
+    if not topic:
+        raise APIError("topic cannot be empty", 400)
+
+    model = data.get("model", current_app.config.get("OLLAMA_MODEL", "gemma3:4b"))
+    voicevox_service = current_app.voicevox_service
+    audio_manager = current_app.audio_manager
+
+    # サーバーやモデルが使えない場合はストリームを開始する前にエラーを返す
+    try:
+        script_lines = current_app.ollama_service.stream_manzai_script(topic, model)
+    except Exception as e:
+        logger.error(f"Error generating script: {e}")
+        raise APIError(f"Failed to generate script: {e!s}", 500)
+
+    def events() -> Iterator[bytes]:
+        pending: Deque[Tuple[int, ScriptLine, Future]] = deque()
+
+        def flush(wait: bool) -> Iterator[bytes]:
+            # 先頭の行から順に、合成が終わったものを送る
+            while pending and (wait or pending[0][2].done()):
+                i, line, future = pending.popleft()
+                audio_file = audio_manager.save_audio(future.result(), f"script_{i}")
+                yield _sse(
+                    {"role": line.role.value.upper(), "text": line.text, "audio_file": audio_file}
+                )
+
+        try:
+            for i, line in enumerate(script_lines):
+                future = voicevox_service.generate_voice_async(line.text, _speaker_id(line))
+                pending.append((i, line, future))
+                yield from flush(wait=False)
+            yield from flush(wait=True)
+            yield _sse({}, event="done")
+        except Exception as e:
+            logger.error(f"Error streaming script: {e}")
+            yield _sse({"error": f"Failed to generate script: {e!s}"}, event="error")
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
+    return Response(stream_with_context(events()), mimetype="text/event-stream")
+
+
+@api_bp.route("/generate-batch", methods=["POST"])
+@api_error_handler
+def generate_batch():
+    """複数のトピックの漫才スクリプトをまとめて生成（音声合成は行わない）"""
+    data = request.get_json(silent=True) or {}
+    topics = data.get("topics")
+    if not isinstance(topics, list) or not topics:
+        raise APIError("topics must be a non-empty list", 400)
+    if not all(isinstance(topic, str) and topic.strip() for topic in topics):
+        raise APIError("topics cannot contain empty values", 400)
+
+    model = data.get("model", current_app.config.get("OLLAMA_MODEL", "gemma3:4b"))
+
+    try:
+        scripts = current_app.ollama_service.generate_manzai_scripts_batch(
+            [topic.strip() for topic in topics], model
+        )
+    except Exception as e:
+        logger.error(f"Error generating scripts: {e}")
+        raise APIError(f"Failed to generate scripts: {e!s}", 500)
+
+    return jsonify(
+        {
+            "scripts": [
+                [{"role": line.role.value.upper(), "text": line.text} for line in script]
+                for script in scripts
+            ]
+        }
+    )
+
+
 @api_bp.route("/speakers", methods=["GET"])
 @api_error_handler
 def get_speakers():
@@ -213,8 +371,6 @@ def get_audio(filename):
         # テストではget_audioメソッドをモックしているのでそれを使用
         audio_data = audio_manager.get_audio(filename)
 
-        from flask import Response
-
         return Response(
             audio_data,
             mimetype="audio/wav",
@@ -234,8 +390,17 @@ def list_audio_files():
     audio_manager = current_app.audio_manager
 
     try:
+        # ディレクトリが変化していなければ一覧を作らずに304を返す
+        etag = str(audio_manager.state_token())
+        if request.if_none_match.contains(etag):
+            not_modified = Response(status=304)
+            not_modified.set_etag(etag)
+            return not_modified
+
         files = audio_manager.list_audio_files()
-        return jsonify(files)
+        response = jsonify(files)
+        response.set_etag(etag)
+        return response
     except Exception as e:
         logger.error(f"Error listing audio files: {e}")
         raise APIError(f"Failed to list audio files: {e!s}", 500)
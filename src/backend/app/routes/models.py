@@ -3,7 +3,7 @@
 import glob
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from flask import jsonify, request
 
@@ -13,6 +13,59 @@ from src.backend.app.utils.error_handlers import APIError, api_error_handler
 # モデルディレクトリパス（開発環境と本番環境で異なる可能性あり）
 LIVE2D_BASE_DIR = os.path.join(os.getcwd(), "frontend", "public", "live2d", "models")
 
+# model.json の解析結果キャッシュ {model_dir: (st_mtime_ns, thumbnail有無, model_info)}
+_MODEL_CACHE: Dict[str, Tuple[int, bool, Dict[str, Any]]] = {}
+
+
+def _load_model_info(model_dir: str, model_name: str) -> Optional[Dict[str, Any]]:
+    """モデルディレクトリからモデル情報を取得する
+
+    model.json の st_mtime_ns とサムネイルの有無が前回と同じ場合は再解析しない。
+
+    Args:
+        model_dir: モデルディレクトリのパス
+        model_name: モデル名（ディレクトリ名）
+
+    Returns:
+        モデル情報の辞書。model.json が無い、または解析できない場合はNone
+    """
+    # 1回のディレクトリ走査で model.json の stat とサムネイルの有無を取得
+    model_json_mtime_ns: Optional[int] = None
+    has_thumbnail = False
+    with os.scandir(model_dir) as entries:
+        for entry in entries:
+            if entry.name == "model.json":
+                model_json_mtime_ns = entry.stat().st_mtime_ns
+            elif entry.name == "thumbnail.png":
+                has_thumbnail = True
+
+    if model_json_mtime_ns is None:
+        _MODEL_CACHE.pop(model_dir, None)
+        return None
+
+    cached = _MODEL_CACHE.get(model_dir)
+    if cached is not None and cached[0] == model_json_mtime_ns and cached[1] == has_thumbnail:
+        return cached[2]
+
+    try:
+        with open(os.path.join(model_dir, "model.json"), "rb") as f:
+            model_data = json.loads(f.read())
+    except json.JSONDecodeError:
+        # JSON解析エラーは無視してスキップ
+        _MODEL_CACHE.pop(model_dir, None)
+        return None
+
+    # モデル情報を構築
+    model_info = {
+        "id": model_name,
+        "name": model_data.get("name", model_name),
+        "path": f"/live2d/models/{model_name}/model.json",
+        "type": model_data.get("type", "unknown"),
+        "thumbnail": f"/live2d/models/{model_name}/thumbnail.png" if has_thumbnail else None,
+    }
+    _MODEL_CACHE[model_dir] = (model_json_mtime_ns, has_thumbnail, model_info)
+    return model_info
+
 
 @api_bp.route("/models/live2d", methods=["GET"])
 @api_error_handler
@@ -32,29 +85,9 @@ def get_live2d_models() -> Dict[str, Any]:
         for model_dir in glob.glob(os.path.join(LIVE2D_BASE_DIR, "*/")):
             model_name = os.path.basename(os.path.dirname(model_dir))
 
-            # model.json ファイルの検索
-            model_json_path = os.path.join(model_dir, "model.json")
-
-            if os.path.exists(model_json_path):
-                try:
-                    with open(model_json_path, "r", encoding="utf-8") as f:
-                        model_data = json.load(f)
-
-                    # モデル情報を構築
-                    model_info = {
-                        "id": model_name,
-                        "name": model_data.get("name", model_name),
-                        "path": f"/live2d/models/{model_name}/model.json",
-                        "type": model_data.get("type", "unknown"),
-                        "thumbnail": f"/live2d/models/{model_name}/thumbnail.png"
-                        if os.path.exists(os.path.join(model_dir, "thumbnail.png"))
-                        else None,
-                    }
-
-                    models.append(model_info)
-                except json.JSONDecodeError:
-                    # JSON解析エラーは無視してスキップ
-                    continue
+            model_info = _load_model_info(model_dir, model_name)
+            if model_info is not None:
+                models.append(model_info)
 
         return jsonify({"models": models})
     except Exception as e:
@@ -1,27 +1,81 @@
+import itertools
 import os
-from datetime import datetime
+import time
+from operator import itemgetter
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple, Union
+
+# 1回の writev に渡すバッファ数の上限（Linux の IOV_MAX）
+_IOV_MAX = 1024
+
+
+def _write_chunks(fd: int, chunks: List[memoryview]) -> None:
+    """複数のバッファを連結せずにファイルへ書き込む
+
+    Args:
+        fd: 書き込み先のファイルディスクリプタ
+        chunks: 書き込むバッファのリスト（書き込み済みの分は取り除かれる）
+    """
+    while chunks:
+        written = os.writev(fd, chunks[:_IOV_MAX])
+        # 書き込みが完了したバッファを取り除き、途中までのバッファは残りを切り出す
+        while chunks and written >= len(chunks[0]):
+            written -= len(chunks[0])
+            chunks.pop(0)
+        if written:
+            chunks[0] = chunks[0][written:]
 
 
 class AudioManager:
     """音声ファイルの管理を担当するクラス"""
 
-    def __init__(self, audio_dir: str = "audio") -> None:
+    # 同一秒内に保存されたファイル名の衝突を避けるための連番
+    _counter = itertools.count()
+
+    def __init__(self, audio_dir: str = "audio", list_cache_ttl: float = 3.0) -> None:
         """AudioManagerの初期化
 
         Args:
             audio_dir (str): 音声ファイルを保存するディレクトリ
+            list_cache_ttl (float): ファイル一覧キャッシュの有効期間（秒）
         """
         self.audio_dir = audio_dir
         os.makedirs(audio_dir, exist_ok=True)
+        # ディレクトリは作成済みなので、パスの組み立てに使う値を一度だけ計算しておく
+        self._audio_path = Path(audio_dir)
+        self._audio_prefix = os.path.join(audio_dir, "")
+        self.list_cache_ttl = list_cache_ttl
+        # (有効期限, ディレクトリのmtime, ファイル名リスト) のキャッシュ
+        self._list_cache: Optional[Tuple[float, float, List[str]]] = None
+        # (UNIX秒, フォーマット済みタイムスタンプ) のキャッシュ
+        self._ts_cache: Tuple[int, str] = (0, "")
 
-    def save_audio(self, audio_data: bytes, filename: str) -> str:
+    def _timestamp(self) -> str:
+        """秒単位のタイムスタンプ文字列を取得
+
+        同じ秒のうちはフォーマット済みの文字列を再利用する。
+
+        Returns:
+            str: "%Y%m%d_%H%M%S" 形式のタイムスタンプ
+        """
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%Y%m%d_%H%M%S", time.localtime(now)))
+        return self._ts_cache[1]
+
+    def save_audio(
+        self,
+        audio_data: Union[bytes, memoryview, List[bytes]],
+        filename: str,
+        durable: bool = False,
+    ) -> str:
         """音声データをファイルとして保存
 
         Args:
-            audio_data (bytes): 保存する音声データ
+            audio_data (Union[bytes, memoryview, List[bytes]]): 保存する音声データ。
+                チャンクのリストの場合は連結せずにそのまま書き込む
             filename (str): ファイル名
+            durable (bool): Trueの場合、書き込み後にディスクへ同期する
 
         Returns:
             str: 保存されたファイルのパス
@@ -35,19 +89,27 @@ class AudioManager:
         if not filename:
             raise ValueError("invalid filename")
 
-        # ファイル名から.wavを削除（重複を避けるため）
-        if filename.endswith(".wav"):
-            filename = filename[:-4]
-
-        # タイムスタンプを付加したファイル名を生成
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_filename = f"{timestamp}_{filename}.wav"
-        file_path = os.path.join(self.audio_dir, safe_filename)
-
-        # 音声データを保存
-        with open(file_path, "wb") as f:
-            f.write(audio_data)
-
+        # タイムスタンプと連番を付加したファイル名を生成
+        # （拡張子の重複を避けるため、末尾の.wavは取り除いてから付け直す）
+        seq = next(self._counter) % 1_000_000
+        safe_filename = f"{self._timestamp()}_{seq:06d}_{filename.removesuffix('.wav')}.wav"
+        file_path = f"{self._audio_prefix}{safe_filename}"
+
+        if isinstance(audio_data, list):
+            chunks = [memoryview(chunk) for chunk in audio_data]
+        else:
+            chunks = [memoryview(audio_data)]
+
+        # 音声データを保存（バッファ層を介さずに直接書き込む）
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _write_chunks(fd, chunks)
+            if durable:
+                os.fdatasync(fd)
+        finally:
+            os.close(fd)
+
+        self._list_cache = None
         return safe_filename
 
     def get_audio(self, filename: str) -> bytes:
@@ -66,13 +128,22 @@ class AudioManager:
         if not filename.endswith(".wav"):
             filename = f"{filename}.wav"
 
-        file_path = os.path.join(self.audio_dir, filename)
+        try:
+            with open(f"{self._audio_prefix}{filename}", "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Audio file not found: {filename}") from None
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Audio file not found: {filename}")
+    def _scan_audio_files(self) -> List[Tuple[str, float]]:
+        """音声ファイルを作成時刻の新しい順に取得
 
-        with open(file_path, "rb") as f:
-            return f.read()
+        Returns:
+            List[Tuple[str, float]]: (ファイル名, 作成時刻) のリスト
+        """
+        with os.scandir(self.audio_dir) as it:
+            entries = [(e.name, e.stat().st_ctime) for e in it if e.name.endswith(".wav")]
+        entries.sort(key=itemgetter(1), reverse=True)
+        return entries
 
     def cleanup_old_files(self, max_files: int = 10) -> int:
         """古い音声ファイルを削除
@@ -84,24 +155,20 @@ class AudioManager:
             int: 削除されたファイル数
         """
         # ディレクトリ内のファイル一覧を取得
-        if not os.path.exists(self.audio_dir):
-            return 0
-
-        files = [f for f in os.listdir(self.audio_dir) if f.endswith(".wav")]
-
-        # ファイルの作成時刻でソート
-        file_paths = [os.path.join(self.audio_dir, f) for f in files]
-        file_paths.sort(key=os.path.getctime, reverse=True)
+        entries = self._scan_audio_files()
 
         # 古いファイルを削除
         deleted_count = 0
-        for file_path in file_paths[max_files:]:
+        for name, _ in entries[max_files:]:
+            file_path = f"{self._audio_prefix}{name}"
             try:
                 os.remove(file_path)
                 deleted_count += 1
             except OSError as e:
                 print(f"Failed to remove file {file_path}: {e}")
 
+        if deleted_count:
+            self._list_cache = None
         return deleted_count
 
     def get_audio_file_path(self, filename: str) -> Path:
@@ -115,7 +182,7 @@ class AudioManager:
         """
         if not filename.endswith(".wav"):
             filename = f"{filename}.wav"
-        return Path(self.audio_dir) / filename
+        return self._audio_path / filename
 
     def get_audio_url(self, filename: str) -> str:
         """音声ファイルのURLを取得
@@ -136,19 +203,27 @@ class AudioManager:
         Returns:
             List[str]: ファイル名のリスト
         """
-        if not os.path.exists(self.audio_dir):
-            return []
+        # ディレクトリに変更がなく有効期限内であればキャッシュを返す
+        now = time.monotonic()
+        dir_mtime = os.stat(self.audio_dir).st_mtime
+        cache = self._list_cache
+        if cache is not None and now < cache[0] and cache[1] == dir_mtime:
+            return list(cache[2])
+
+        names = [name for name, _ in self._scan_audio_files()]
+        self._list_cache = (now + self.list_cache_ttl, dir_mtime, names)
+        return list(names)
 
-        files = []
-        for filename in os.listdir(self.audio_dir):
-            if filename.endswith(".wav"):
-                files.append(filename)
+    def state_token(self) -> int:
+        """音声ディレクトリの状態を表すトークンを取得
 
-        # 作成時刻でソート（新しいものが先）
-        file_paths = [(f, os.path.join(self.audio_dir, f)) for f in files]
-        file_paths.sort(key=lambda x: os.path.getctime(x[1]), reverse=True)
+        ファイルの追加・削除でディレクトリの更新時刻が変わるため、1回のstatで
+        一覧が変化したかどうかを判定できる（HTTPのETagとして利用する）。
 
-        return [f[0] for f in file_paths]
+        Returns:
+            int: ディレクトリの更新時刻（ナノ秒）
+        """
+        return os.stat(self.audio_dir).st_mtime_ns
 
     def generate_filename(self, prefix: str = "audio", extension: str = "wav") -> str:
         """一意のファイル名を生成
@@ -160,5 +235,6 @@ class AudioManager:
         Returns:
             str: 生成されたファイル名
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        return f"{prefix}_{timestamp}.{extension}"
+        seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(seconds))
+        return f"{prefix}_{timestamp}_{nanoseconds // 1000:06d}.{extension}"
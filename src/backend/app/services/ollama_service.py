@@ -4,30 +4,153 @@ LLMとの通信を担当するサービス
 
 import json
 import logging
+import math
 import os
-from datetime import datetime
-from typing import Any, Dict, List, Optional, TypedDict, Union, cast
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging.handlers import TimedRotatingFileHandler
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, TypedDict, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.backend.app.models.script import Role, ScriptLine
+from src.backend.app.utils import json_utils
+from src.backend.app.utils.logger import queue_handler
 from src.backend.app.utils.prompt_loader import PromptLoader
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# ログディレクトリの作成
-os.makedirs("logs", exist_ok=True)
+# ファイルハンドラー（最初のクライアント生成時に設定する）
+_FILE_HANDLER_NAME = "ollama_client_file"
+_file_handler_lock = threading.Lock()
+
+
+def _ensure_file_handler() -> None:
+    """ファイルハンドラーを一度だけ設定
+
+    ログファイルは日付が変わるとローテーションされ、最初のログ出力まで開かれない。
+    ファイルへの書き込みはバックグラウンドのスレッドで行い、リクエストを処理する
+    スレッドはディスクI/Oを待たない。
+    ハンドラーの有無はロガー自体で判定するため、モジュールが再読み込みされたり
+    複数のスレッドから同時にクライアントが作られたりしても重複して追加されない。
+    出力先は環境変数 OLLAMA_LOG_DIR（既定値 "logs"）で変更でき、空文字の場合は
+    ファイルに出力しない（テスト実行時など）。
+    """
+    log_dir = os.environ.get("OLLAMA_LOG_DIR", "logs")
+    if not log_dir:
+        return
+
+    with _file_handler_lock:
+        if any(handler.name == _FILE_HANDLER_NAME for handler in logger.handlers):
+            return
+
+        # ログディレクトリの作成
+        os.makedirs(log_dir, exist_ok=True)
+
+        fh = TimedRotatingFileHandler(
+            os.path.join(log_dir, "ollama_client.log"),
+            when="midnight",
+            encoding="utf-8",
+            delay=True,
+        )
+        fh.setLevel(logging.DEBUG)
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        fh.setFormatter(formatter)
+        file_handler = queue_handler(fh)
+        file_handler.set_name(_FILE_HANDLER_NAME)
+        logger.addHandler(file_handler)
+
+
+# ```json ～ ``` 形式のコードブロック
+_JSON_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
 
-# ファイルハンドラーの設定
-fh = logging.FileHandler(
-    f"logs/ollama_client_{datetime.now().strftime('%Y%m%d')}.log", encoding="utf-8"
+# ``` で囲まれたコードブロック（閉じられていない最後のブロックも含む）
+_CODE_BLOCK_RE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+# 「話者: セリフ」形式の台本行（半角・全角コロンの両方に対応）
+_SCRIPT_LINE_RE = re.compile(
+    r"^[^\S\n]*([^\s:：][^:：\n]*?)[^\S\n]*[:：][^\S\n]*(\S.*?)[^\S\n]*$", re.MULTILINE
 )
-fh.setLevel(logging.DEBUG)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-fh.setFormatter(formatter)
-logger.addHandler(fh)
+
+# 台本の話者ラベルとロールの対応（未知の話者はボケとして扱う）
+_ROLE_MAP = {"A": Role.TSUKKOMI, "B": Role.BOKE}
+
+# シリアライズ済みのリクエストボディを送る際のヘッダー
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# リクエストのタイムアウト (接続, 読み取り) 秒
+# 接続できない場合は読み取りの待ち時間に関係なくすぐに失敗させる
+_CONNECT_TIMEOUT = 3.05
+_GENERATE_TIMEOUT = (_CONNECT_TIMEOUT, 60.0)  # 読み取りはトークン間の待ち時間に適用される
+_LIST_TIMEOUT = (_CONNECT_TIMEOUT, 10.0)
+_PROBE_TIMEOUT = (_CONNECT_TIMEOUT, 5.0)
+
+# 可用性チェックで試すエンドポイントと、モデル一覧が入っているキー
+_AVAILABILITY_ENDPOINTS: List[Tuple[str, str]] = [
+    ("api/tags", "models"),  # 一般的なエンドポイント
+    ("api/models", "models"),  # 新しいバージョンのAPI
+]
+
+
+def _num_parallel() -> int:
+    """Ollamaへ同時に送るリクエスト数の上限を環境変数から取得
+
+    Ollamaサーバーの OLLAMA_NUM_PARALLEL と同じ値を設定すると、
+    サーバー側のキューで待たせずに処理できる件数だけ並行させる。
+
+    Returns:
+        同時リクエスト数の上限（未設定または不正な値の場合は4）
+    """
+    try:
+        return max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")))
+    except ValueError:
+        return 4
+
+
+def _topic_vector(topic: str) -> Dict[str, float]:
+    """トピックの文字bigramから正規化済みの頻度ベクトルを作成
+
+    表記ゆれ（全角・半角、大文字・小文字、空白）を吸収してから数えるため、
+    「スマート フォン」と「スマートフォン」はほぼ同じベクトルになる。
+
+    Args:
+        topic: トピック
+
+    Returns:
+        bigramをキー、L2正規化した頻度を値とする辞書
+    """
+    text = "".join(unicodedata.normalize("NFKC", topic).lower().split())
+    grams = Counter(text[i : i + 2] for i in range(len(text) - 1)) or Counter(text)
+    norm = math.sqrt(sum(count * count for count in grams.values()))
+    return {gram: count / norm for gram, count in grams.items()} if norm else {}
+
+
+def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """正規化済みベクトル同士のコサイン類似度を計算"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(gram, 0.0) for gram, weight in a.items())
+
+
+def _health_interval() -> Optional[float]:
+    """バックグラウンドで可用性を確認する間隔を環境変数から取得
+
+    Returns:
+        OLLAMA_HEALTH_INTERVAL の秒数（未設定、0以下、または不正な値の場合はNone）
+    """
+    try:
+        interval = float(os.environ.get("OLLAMA_HEALTH_INTERVAL", ""))
+    except ValueError:
+        return None
+    return interval if interval > 0 else None
 
 
 class OllamaServiceError(Exception):
@@ -46,25 +169,111 @@ class ScriptItem(TypedDict):
 class OllamaClient:
     """Ollama APIとの通信を行うクライアント"""
 
-    def __init__(self, base_url: str | None = None, instance_type: str = "local") -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        instance_type: str = "local",
+        availability_ttl: float = 5.0,
+        health_interval: Optional[float] = None,
+    ) -> None:
         """OllamaClientの初期化
 
         Args:
             base_url: Ollama APIのベースURL
             instance_type: Ollamaのインスタンスタイプ ("local" または "docker")
+            availability_ttl: 可用性チェック結果をキャッシュする秒数
+            health_interval: バックグラウンドで可用性を確認する間隔の秒数。
+                Noneの場合は環境変数 OLLAMA_HEALTH_INTERVAL を使い、それも未設定なら
+                リクエスト時に確認する
         """
+        _ensure_file_handler()
+
         # 環境変数から設定を読み込む（引数が指定されていない場合）
         if base_url is None:
             base_url = os.environ.get("OLLAMA_URL", "http://localhost:11434")
 
         self.base_url = base_url
         self.instance_type = instance_type
+
+        # 接続を再利用するためのセッション（keep-aliveでTCP接続の確立を省く）
+        self._session = requests.Session()
+        # 一時的なゲートウェイエラーは短い間隔で再試行する
+        # （urllib3の既定では冪等なメソッドのみが対象で、生成のPOSTは再送されない。
+        # 接続できない場合は可用性チェックを遅らせないよう再試行しない）
+        retry = Retry(
+            total=2,
+            connect=0,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,  # 再試行しきった場合は最後のレスポンスをそのまま返す
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Connection"] = "keep-alive"
+
+        # 可用性チェック結果のキャッシュ (取得時刻, 結果)
+        self._availability_ttl = availability_ttl
+        self._availability_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # 前回の可用性チェックで応答したエンドポイント（次回はこれを最初に試す）
+        self._preferred_endpoint: Optional[Tuple[str, str]] = None
+
+        # バックグラウンドで可用性を確認し、リクエストのスレッドでは結果を読むだけにする
+        # （確認の間隔より長くキャッシュを保持し、更新の合間に期限切れにならないようにする）
+        if health_interval is None:
+            health_interval = _health_interval()
+        self._health_stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        if health_interval is not None:
+            self._availability_ttl = max(availability_ttl, 2 * health_interval)
+            self._health_thread = threading.Thread(
+                target=self._watch_health,
+                args=(health_interval,),
+                name="ollama-health",
+                daemon=True,
+            )
+            self._health_thread.start()
+
+        # 独立したHTTP呼び出しを並行して実行するためのワーカー
+        # （サーバーが同時に処理できる件数 OLLAMA_NUM_PARALLEL に合わせる）
+        self._executor = ThreadPoolExecutor(
+            max_workers=_num_parallel(), thread_name_prefix="ollama-client"
+        )
+        # ステータス確認用の短いリクエストは、生成で埋まったワーカーの後ろに並ばないよう分ける
+        self._probe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ollama-probe")
         logger.info(
             f"OllamaClient initialized with base URL: {base_url} (instance: {instance_type})"
         )
 
+    def close(self) -> None:
+        """可用性の確認とワーカーを停止し、HTTPセッションを閉じてプール中の接続を解放"""
+        self._health_stop.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._probe_executor.shutdown(wait=True, cancel_futures=True)
+        self._session.close()
+
+    def _request_error(self, e: requests.exceptions.RequestException) -> OllamaServiceError:
+        """通信中に発生した例外をOllamaServiceErrorに変換してログに記録
+
+        サーバーの状態が変わった可能性があるため、可用性チェックのキャッシュも破棄する。
+        """
+        self.invalidate_availability_cache()
+        if isinstance(e, requests.exceptions.ConnectionError):
+            error_message = f"Connection error with Ollama API: {e!s}"
+        elif isinstance(e, requests.exceptions.Timeout):
+            error_message = f"Timeout error with Ollama API: {e!s}"
+        else:
+            error_message = f"Error communicating with Ollama API: {e!s}"
+        logger.error(error_message)
+        return OllamaServiceError(error_message)
+
     def _prepare_request_data(
-        self, prompt: str, model_name: str, options: Optional[Dict[str, Any]] = None
+        self,
+        prompt: str,
+        model_name: str,
+        options: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         """APIリクエスト用のデータを準備
 
@@ -72,6 +281,7 @@ class OllamaClient:
             prompt: プロンプト
             model_name: モデル名
             options: 生成オプション
+            stream: レスポンスをNDJSONのストリームで受け取るかどうか
 
         Returns:
             リクエストデータの辞書
@@ -79,7 +289,7 @@ class OllamaClient:
         request_data: Dict[str, Any] = {
             "model": model_name,
             "prompt": prompt,
-            "stream": False,
+            "stream": stream,
         }
 
         if options:
@@ -92,6 +302,7 @@ class OllamaClient:
         prompt: str,
         model_name: str = "gemma3:4b",
         options: Optional[Dict[str, Any]] = None,
+        skip_availability_check: bool = False,
     ) -> str:
         """テキスト生成を同期的に実行
 
@@ -99,6 +310,8 @@ class OllamaClient:
             prompt: プロンプト
             model_name: モデル名
             options: 生成オプション
+            skip_availability_check: 呼び出し元でサーバーとモデルの可用性を
+                確認済みの場合はTrue
 
         Returns:
             生成されたテキスト
@@ -106,47 +319,88 @@ class OllamaClient:
         Raises:
             OllamaServiceError: API呼び出しに失敗した場合
         """
-        request_data = self._prepare_request_data(prompt, model_name, options)
-
-        # Ollamaサーバーの状態とモデルの可用性を確認
-        status = self.check_ollama_availability()
-        if not status["available"]:
-            raise OllamaServiceError(f"Ollama server is not available: {status['error']}")
-
-        # モデルの存在確認
-        if model_name not in status["models"]:
-            available_models = ", ".join(status["models"]) if status["models"] else "none"
-            error_message = (
-                f"Requested model '{model_name}' is not available. "
-                f"Available models: {available_models}"
+        return "".join(
+            self.generate_text_stream(
+                prompt, model_name, options, skip_availability_check=skip_availability_check
             )
-            logger.error(error_message)
-            raise OllamaServiceError(error_message)
+        )
+
+    def generate_text_stream(
+        self,
+        prompt: str,
+        model_name: str = "gemma3:4b",
+        options: Optional[Dict[str, Any]] = None,
+        skip_availability_check: bool = False,
+    ) -> Iterator[str]:
+        """生成されたテキストを受信した順に返すジェネレーター
 
-        # テキスト生成リクエスト
+        Args:
+            prompt: プロンプト
+            model_name: モデル名
+            options: 生成オプション
+            skip_availability_check: 呼び出し元でサーバーとモデルの可用性を
+                確認済みの場合はTrue
+
+        Yields:
+            生成されたテキストの断片
+
+        Raises:
+            OllamaServiceError: API呼び出しに失敗した場合
+        """
+        request_data = self._prepare_request_data(prompt, model_name, options, stream=True)
+
+        if not skip_availability_check:
+            # Ollamaサーバーの状態とモデルの可用性を確認
+            status = self.check_ollama_availability()
+            if status["available"] and model_name not in status["models"]:
+                # キャッシュ取得後にモデルが追加された可能性があるため再確認する
+                self.invalidate_availability_cache()
+                status = self.check_ollama_availability()
+            if not status["available"]:
+                raise OllamaServiceError(f"Ollama server is not available: {status['error']}")
+
+            # モデルの存在確認
+            if model_name not in status["models"]:
+                available_models = ", ".join(status["models"]) if status["models"] else "none"
+                error_message = (
+                    f"Requested model '{model_name}' is not available. "
+                    f"Available models: {available_models}"
+                )
+                logger.error(error_message)
+                raise OllamaServiceError(error_message)
+
+        # テキスト生成リクエスト（生成されたトークンをNDJSONで逐次受信する）
         try:
-            response = requests.post(f"{self.base_url}/api/generate", json=request_data, timeout=60)
-            response.raise_for_status()
-            response_data = response.json()
+            # requests内部での再シリアライズを避けるため、ボディをエンコード済みで渡す
+            response = self._session.post(
+                f"{self.base_url}/api/generate",
+                data=json_utils.dumps(request_data),
+                headers=_JSON_HEADERS,
+                stream=True,
+                timeout=_GENERATE_TIMEOUT,
+            )
+            try:
+                response.raise_for_status()
+                for line in response.iter_lines(chunk_size=4096):
+                    if not line:
+                        continue
+                    chunk = json_utils.loads(line)
 
-            if "error" in response_data:
-                raise OllamaServiceError(f"Ollama API error: {response_data['error']}")
+                    if "error" in chunk:
+                        raise OllamaServiceError(f"Ollama API error: {chunk['error']}")
 
-            generated_text: str = response_data.get("response", "")
-            return generated_text
+                    text = chunk.get("response", "")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        break
+            finally:
+                response.close()
 
-        except requests.exceptions.ConnectionError as e:
-            error_message = f"Connection error with Ollama API: {e!s}"
-            logger.error(error_message)
-            raise OllamaServiceError(error_message)
-        except requests.exceptions.Timeout as e:
-            error_message = f"Timeout error with Ollama API: {e!s}"
-            logger.error(error_message)
-            raise OllamaServiceError(error_message)
+        except OllamaServiceError:
+            raise
         except requests.exceptions.RequestException as e:
-            error_message = f"Error communicating with Ollama API: {e!s}"
-            logger.error(error_message)
-            raise OllamaServiceError(error_message)
+            raise self._request_error(e)
         except json.JSONDecodeError:
             error_message = "Invalid JSON response from Ollama API"
             logger.error(error_message)
@@ -156,11 +410,84 @@ class OllamaClient:
             logger.exception(error_message)
             raise OllamaServiceError(error_message)
 
+    def generate_text_async(
+        self,
+        prompt: str,
+        model_name: str = "gemma3:4b",
+        options: Optional[Dict[str, Any]] = None,
+        skip_availability_check: bool = False,
+    ) -> "Future[str]":
+        """テキスト生成をワーカースレッドで実行
+
+        複数のプロンプトを続けて投入すると、共有セッションの接続プールを使って
+        生成リクエストが並行して処理される。
+
+        Args:
+            prompt: プロンプト
+            model_name: モデル名
+            options: 生成オプション
+            skip_availability_check: 呼び出し元でサーバーとモデルの可用性を
+                確認済みの場合はTrue
+
+        Returns:
+            生成されたテキストを結果に持つFuture。失敗時は result() が
+            OllamaServiceError を送出する
+        """
+        return self._executor.submit(
+            self.generate_text_sync,
+            prompt,
+            model_name,
+            options,
+            skip_availability_check=skip_availability_check,
+        )
+
+    def generate_many(
+        self,
+        prompts: List[str],
+        model_name: str = "gemma3:4b",
+        options: Optional[Dict[str, Any]] = None,
+        skip_availability_check: bool = False,
+    ) -> List[str]:
+        """複数のプロンプトのテキスト生成を並行して実行
+
+        同時に送るリクエストは OLLAMA_NUM_PARALLEL（既定値4）までに制限される。
+        サーバー側でも同じ値を設定しないと、リクエストはサーバーのキューで順番待ちになる。
+
+        Args:
+            prompts: プロンプトのリスト
+            model_name: モデル名
+            options: 生成オプション（全てのプロンプトで共通）
+            skip_availability_check: 呼び出し元でサーバーとモデルの可用性を
+                確認済みの場合はTrue
+
+        Returns:
+            プロンプトと同じ順序の生成テキストのリスト
+
+        Raises:
+            OllamaServiceError: いずれかの生成に失敗した場合
+        """
+        futures = [
+            self.generate_text_async(
+                prompt,
+                model_name,
+                dict(options) if options else None,
+                skip_availability_check=skip_availability_check,
+            )
+            for prompt in prompts
+        ]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            # 途中で失敗した場合は未着手の生成リクエストを送らない
+            for future in futures:
+                future.cancel()
+
     def generate_json_sync(
         self,
         prompt: str,
         model_name: str = "gemma3:4b",
         options: Optional[Dict[str, Any]] = None,
+        skip_availability_check: bool = False,
     ) -> Dict[str, Any]:
         """JSONレスポンスを生成
 
@@ -168,6 +495,8 @@ class OllamaClient:
             prompt: プロンプト
             model_name: モデル名
             options: 生成オプション
+            skip_availability_check: 呼び出し元でサーバーとモデルの可用性を
+                確認済みの場合はTrue
 
         Returns:
             生成されたJSONオブジェクト
@@ -187,18 +516,48 @@ class OllamaClient:
             }
         )
 
-        raw_text = self.generate_text_sync(prompt, model_name, options)
+        raw_text = self.generate_text_sync(
+            prompt, model_name, options, skip_availability_check=skip_availability_check
+        )
 
         try:
             # JSONブロックを抽出
             json_block = self._extract_json_block(raw_text)
-            json_data: Dict[str, Any] = json.loads(json_block)
+            json_data: Dict[str, Any] = json_utils.loads(json_block)
             return json_data
         except json.JSONDecodeError as e:
             error_message = f"Failed to parse JSON from response: {e!s}"
             logger.error(f"{error_message}\nRaw text: {raw_text}")
             raise OllamaServiceError(error_message)
 
+    def generate_json_async(
+        self,
+        prompt: str,
+        model_name: str = "gemma3:4b",
+        options: Optional[Dict[str, Any]] = None,
+        skip_availability_check: bool = False,
+    ) -> "Future[Dict[str, Any]]":
+        """JSONレスポンスの生成をワーカースレッドで実行
+
+        Args:
+            prompt: プロンプト
+            model_name: モデル名
+            options: 生成オプション
+            skip_availability_check: 呼び出し元でサーバーとモデルの可用性を
+                確認済みの場合はTrue
+
+        Returns:
+            生成されたJSONオブジェクトを結果に持つFuture。失敗時は result() が
+            OllamaServiceError を送出する
+        """
+        return self._executor.submit(
+            self.generate_json_sync,
+            prompt,
+            model_name,
+            options,
+            skip_availability_check=skip_availability_check,
+        )
+
     def _extract_json_block(self, text: str) -> str:
         """テキストからJSONブロックを抽出
 
@@ -212,23 +571,16 @@ class OllamaClient:
             OllamaServiceError: JSONブロックが見つからない場合
         """
         # JSONブロックを抽出（```json～```の形式を想定）
-        if "```json" in text and "```" in text.split("```json", 1)[1]:
-            return text.split("```json", 1)[1].split("```", 1)[0].strip()
-
-        # 単純な中括弧のブロックを探す
-        if "{" in text and "}" in text:
-            start = text.find("{")
-            # 最後の閉じ括弧を見つける（ネストされたJSONを考慮）
-            end = text.rfind("}")
-            if start < end:
-                return text[start : end + 1]
-
-        # 特殊なケース: テキスト全体がJSONとして解析可能な場合はそのまま返す
-        try:
-            json.loads(text)
-            return text
-        except (json.JSONDecodeError, ValueError):
-            pass
+        match = _JSON_FENCE_RE.search(text)
+        if match:
+            return match.group(1).strip()
+
+        # 最初の開き括弧から最後の閉じ括弧までを取り出す（ネストされたJSONを考慮）
+        # 妥当なJSONかどうかは呼び出し元のデコードで判定する
+        start = text.find("{")
+        end = text.rfind("}")
+        if 0 <= start < end:
+            return text[start : end + 1]
 
         raise OllamaServiceError("Could not extract JSON block from response")
 
@@ -241,42 +593,37 @@ class OllamaClient:
         Raises:
             OllamaServiceError: API呼び出しに失敗した場合
         """
+        # 新しいAPI（/api/models）を試し、失敗したら古いAPI（/api/tags）を使う
+        primary_endpoint, fallback_endpoint = "api/models", "api/tags"
         try:
-            # 最初に新しいAPI（/api/models）を試す
-            try:
-                response = requests.get(f"{self.base_url}/api/models", timeout=10)
-                response.raise_for_status()
-                response_data = response.json()
-
-                if "models" in response_data:
-                    return cast(List[Dict[str, Any]], response_data["models"])
-            except (requests.exceptions.RequestException, json.JSONDecodeError):
-                # エラーがあれば古いAPIを試す
-                logger.info("Falling back to /api/tags endpoint")
-
-            # 古いAPI（/api/tags）を試す
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
-            response.raise_for_status()
-            response_data = response.json()
+            for endpoint in (primary_endpoint, fallback_endpoint):
+                try:
+                    response = self._session.get(
+                        f"{self.base_url}/{endpoint}", timeout=_LIST_TIMEOUT
+                    )
+                    response.raise_for_status()
+                    response_data = json_utils.loads(response.content)
+                except (requests.exceptions.RequestException, json.JSONDecodeError):
+                    if endpoint == fallback_endpoint:
+                        raise
+                    logger.info("Falling back to /api/tags endpoint")
+                    continue
 
-            if "error" in response_data:
-                raise OllamaServiceError(f"Ollama API error: {response_data['error']}")
+                # オブジェクト以外の応答はモデル一覧を含まないものとして扱う
+                if not isinstance(response_data, dict):
+                    continue
+                models = response_data.get("models")
+                if isinstance(models, list):
+                    return models
+                if endpoint == fallback_endpoint and "error" in response_data:
+                    raise OllamaServiceError(f"Ollama API error: {response_data['error']}")
 
-            models = response_data.get("models", [])
-            return cast(List[Dict[str, Any]], models)
+            return []
 
-        except requests.exceptions.ConnectionError as e:
-            error_message = f"Connection error with Ollama API: {e!s}"
-            logger.error(error_message)
-            raise OllamaServiceError(error_message)
-        except requests.exceptions.Timeout as e:
-            error_message = f"Timeout error with Ollama API: {e!s}"
-            logger.error(error_message)
-            raise OllamaServiceError(error_message)
+        except OllamaServiceError:
+            raise
         except requests.exceptions.RequestException as e:
-            error_message = f"Error communicating with Ollama API: {e!s}"
-            logger.error(error_message)
-            raise OllamaServiceError(error_message)
+            raise self._request_error(e)
         except json.JSONDecodeError:
             error_message = "Invalid JSON response from Ollama API"
             logger.error(error_message)
@@ -286,9 +633,34 @@ class OllamaClient:
             logger.exception(error_message)
             raise OllamaServiceError(error_message)
 
+    def _watch_health(self, interval: float) -> None:
+        """close() が呼ばれるまで一定間隔で可用性を確認し、結果をキャッシュに保存
+
+        サーバーに接続できない結果も保存するため、停止中のサーバーへのリクエストは
+        確認を待たずに失敗し、次の確認で復旧が反映される。
+
+        Args:
+            interval: 確認の間隔の秒数
+        """
+        while not self._health_stop.is_set():
+            try:
+                result = self._probe_availability()
+            except Exception:
+                logger.exception("Background Ollama health check failed")
+            else:
+                self._availability_cache = (time.monotonic(), result)
+            self._health_stop.wait(interval)
+
+    def invalidate_availability_cache(self) -> None:
+        """可用性チェック結果のキャッシュを破棄"""
+        self._availability_cache = None
+
     def check_ollama_availability(self) -> Dict[str, Any]:
         """Ollamaサーバーの状態と利用可能なモデルを確認
 
+        サーバーが利用可能だった結果は availability_ttl 秒間キャッシュされる。
+        バックグラウンドで確認している場合は、その最新の結果（利用不可を含む）を返す。
+
         Returns:
             状態情報の辞書:
             - "available": bool
@@ -299,6 +671,22 @@ class OllamaClient:
         Note:
             このメソッドは例外を発生させず、状態情報を返す
         """
+        cache = self._availability_cache
+        if cache is not None and time.monotonic() - cache[0] < self._availability_ttl:
+            return dict(cache[1])
+
+        result = self._probe_availability()
+        if result["available"]:
+            self._availability_cache = (time.monotonic(), result)
+            return dict(result)
+        return result
+
+    def _probe_availability(self) -> Dict[str, Any]:
+        """Ollamaサーバーに問い合わせて状態と利用可能なモデルを取得
+
+        Returns:
+            check_ollama_availability と同じ形式の状態情報の辞書
+        """
         result = {
             "available": False,
             "models": [],
@@ -306,20 +694,20 @@ class OllamaClient:
             "instance_type": self.instance_type,
         }
 
-        # 複数のエンドポイントを試す
-        endpoints = [
-            ("api/tags", "models"),  # 一般的なエンドポイント
-            ("api/models", "models"),  # 新しいバージョンのAPI
-        ]
+        # 複数のエンドポイントを試す（前回応答したものを優先）
+        endpoints = _AVAILABILITY_ENDPOINTS
+        preferred = self._preferred_endpoint
+        if preferred is not None:
+            endpoints = [preferred] + [e for e in endpoints if e != preferred]
 
         last_error = None
 
         for endpoint, key in endpoints:
             try:
                 # サーバーの状態確認
-                response = requests.get(f"{self.base_url}/{endpoint}", timeout=5)
+                response = self._session.get(f"{self.base_url}/{endpoint}", timeout=_PROBE_TIMEOUT)
                 response.raise_for_status()
-                data = response.json()
+                data = json_utils.loads(response.content)
 
                 # 利用可能なモデルを取得
                 if key in data and isinstance(data[key], list):
@@ -329,6 +717,7 @@ class OllamaClient:
                     result["available"] = True
                     result["models"] = model_names
                     result["instance_info"] = f"{self.instance_type} ({endpoint})"
+                    self._preferred_endpoint = (endpoint, key)
                     return result
                 else:
                     logger.debug(
@@ -354,6 +743,7 @@ class OllamaClient:
                 )
 
         # すべてのエンドポイントが失敗した場合
+        self._preferred_endpoint = None
         result["error"] = last_error or "All endpoints failed"
         return result
 
@@ -373,6 +763,9 @@ class OllamaClient:
             "response_time_ms": 0,
         }
 
+        # APIバージョンの取得を可用性チェックと並行して開始する
+        version_future = self._probe_executor.submit(self._fetch_api_version)
+
         # 可用性チェック
         availability = self.check_ollama_availability()
         status.update(
@@ -386,34 +779,57 @@ class OllamaClient:
         # APIバージョンの取得を試みる
         if status["available"]:
             try:
-                start_time = datetime.now()
-                response = requests.get(f"{self.base_url}/api/version", timeout=5)
-                end_time = datetime.now()
-
-                if response.status_code == 200:
-                    version_data = response.json()
-                    status["api_version"] = version_data.get("version", "unknown")
-
-                # レスポンス時間を計測
-                response_time = (end_time - start_time).total_seconds() * 1000
-                status["response_time_ms"] = round(response_time)
+                api_version, response_time_ms = version_future.result(timeout=sum(_PROBE_TIMEOUT))
+                if api_version is not None:
+                    status["api_version"] = api_version
+                status["response_time_ms"] = response_time_ms
             except Exception as e:
                 logger.warning(f"Failed to get API version: {e!s}")
 
         return status
 
+    def _fetch_api_version(self) -> Tuple[Optional[str], int]:
+        """APIバージョンを取得し、応答時間を計測
+
+        Returns:
+            (APIバージョン（取得できなかった場合はNone）, 応答時間（ミリ秒）) のタプル
+        """
+        start_time = time.perf_counter()
+        response = self._session.get(f"{self.base_url}/api/version", timeout=_PROBE_TIMEOUT)
+        end_time = time.perf_counter()
+
+        api_version = None
+        if response.status_code == 200:
+            version_data = json_utils.loads(response.content)
+            api_version = version_data.get("version", "unknown")
+
+        # レスポンス時間を計測
+        response_time = (end_time - start_time) * 1000
+        return api_version, round(response_time)
+
 
 class OllamaService:
     """OllamaサービスのインターフェースとなるクラスでLLMとの通信を行う"""
 
-    def __init__(self, base_url: str | None = None, instance_type: str = "auto") -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        instance_type: str = "auto",
+        script_cache_size: int = 64,
+        semantic_cache_threshold: Optional[float] = None,
+    ) -> None:
         """OllamaServiceの初期化
 
         Args:
             base_url: Ollama APIのベースURL
             instance_type: Ollamaのインスタンスタイプ ("local", "docker", または "auto")
                            "auto"の場合はURLに基づいて自動検出
+            script_cache_size: 生成済みの台本を保持する件数（0でキャッシュしない）
+            semantic_cache_threshold: 表記の近いトピックの台本を再利用するコサイン類似度の
+                しきい値（例: 0.92）。Noneの場合は完全一致のときだけ再利用する
         """
+        _ensure_file_handler()
+
         # 環境変数から設定を読み込む（引数が指定されていない場合）
         if base_url is None:
             base_url = os.environ.get("OLLAMA_URL", "http://localhost:11434")
@@ -435,8 +851,25 @@ class OllamaService:
         self.base_url = base_url
         self.prompts: Dict[str, str] = {}  # プロンプトキャッシュ
         self.prompt_loader = PromptLoader()
+        # 同じトピックの再生成でLLMを待たないよう (モデル名, プロンプト) ごとに台本を保持する
+        # 値は呼び出し側の変更が波及しないよう (ロール, セリフ) のタプル
+        self._script_cache_size = script_cache_size
+        self._script_cache: "OrderedDict[Tuple[str, str], Tuple[Tuple[Role, str], ...]]" = (
+            OrderedDict()
+        )
+        # 表記の近いトピックを探すための (テンプレート, トピックのベクトル, 台本のキー)
+        # テンプレートはプロンプトからトピックを除いたもので、編集前の台本を使わないために比較する
+        self._semantic_cache_threshold = semantic_cache_threshold
+        self._semantic_cache: Deque[Tuple[str, Dict[str, float], Tuple[str, str]]] = deque(
+            maxlen=max(script_cache_size, 0)
+        )
+        self._script_cache_lock = threading.Lock()
         logger.info(f"OllamaService initialized with {detected_type} instance at {base_url}")
 
+    def close(self) -> None:
+        """クライアントが保持する接続とワーカーを解放"""
+        self.client.close()
+
     def _parse_manzai_script(self, data: Union[str, Dict[str, Any]]) -> List[ScriptLine]:
         """漫才スクリプトを解析してScriptLineのリストを返す
 
@@ -451,50 +884,33 @@ class OllamaService:
                 raise OllamaServiceError("Script not found in response")
             script_data = data["script"]
             if isinstance(script_data, list):
-                script_items = []
-                for item in script_data:
-                    if not isinstance(item, dict) or "speaker" not in item or "text" not in item:
-                        continue
-                    speaker = item["speaker"].strip()
-                    text = item["text"].strip()
-                    if not speaker or not text:
-                        continue
-                    role = Role.TSUKKOMI if speaker == "A" else Role.BOKE
-                    script_items.append(ScriptLine(role=role, text=text))
-                return script_items
+                # 話者とセリフがそろっていない項目は読み飛ばす
+                pairs = (
+                    (item["speaker"].strip(), item["text"].strip())
+                    for item in script_data
+                    if isinstance(item, dict) and "speaker" in item and "text" in item
+                )
+                return [
+                    ScriptLine(role=_ROLE_MAP.get(speaker, Role.BOKE), text=text)
+                    for speaker, text in pairs
+                    if speaker and text
+                ]
             text = script_data
         else:
             text = data
 
-        # コードブロックの抽出
-        if "```" in text:
-            blocks = text.split("```")
-            # 奇数番目のブロック（コードブロック内）を探す
-            for i, block in enumerate(blocks):
-                if i % 2 == 1 and block.strip():  # コードブロック内（1, 3, 5...）
-                    text = block.strip()
-                    break
-
-        # 行ごとに分割して解析
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
-        script_items = []
-
-        for line in lines:
-            if ":" not in line:
-                continue
-
-            speaker, content = line.split(":", 1)
-            speaker = speaker.strip()
-            content = content.strip()
-
-            if not speaker or not content:
-                continue
+        # コードブロックの抽出（空でない最初のブロックを使う）
+        for match in _CODE_BLOCK_RE.finditer(text):
+            block = match.group(1).strip()
+            if block:
+                text = block
+                break
 
-            # 話者に応じてロールを割り当て
-            role = Role.TSUKKOMI if speaker == "A" else Role.BOKE
-            script_items.append(ScriptLine(role=role, text=content))
-
-        return script_items
+        # 「話者: セリフ」形式の行を1回の走査で抽出し、話者に応じてロールを割り当て
+        return [
+            ScriptLine(role=_ROLE_MAP.get(speaker, Role.BOKE), text=content)
+            for speaker, content in _SCRIPT_LINE_RE.findall(text)
+        ]
 
     def check_availability(self) -> Dict[str, Any]:
         """Ollamaサービスの可用性を確認
@@ -525,12 +941,13 @@ class OllamaService:
             "error": None,
         }
 
-        start_time = datetime.now()
+        # 経過時間の計測にはシステム時刻の変更に影響されない時計を使う
+        start_time = time.perf_counter()
         availability = self.check_availability()
-        end_time = datetime.now()
+        end_time = time.perf_counter()
 
         # レイテンシを計算（ミリ秒）
-        latency = (end_time - start_time).total_seconds() * 1000
+        latency = (end_time - start_time) * 1000
         result["latency_ms"] = round(latency)
 
         if availability["available"]:
@@ -541,22 +958,15 @@ class OllamaService:
 
         return result
 
-    def generate_manzai_script(self, topic: str, model_name: str = "gemma3:4b") -> List[ScriptLine]:
-        """指定されたトピックの漫才台本を生成
+    def _ensure_model_available(self, model_name: str) -> None:
+        """サーバーと指定モデルが利用可能か確認
 
         Args:
-            topic: 台本のトピック
             model_name: 使用するLLMモデル名
 
-        Returns:
-            生成された台本
-
         Raises:
-            OllamaServiceError: 台本生成に失敗した場合
+            OllamaServiceError: サーバーに接続できない場合、またはモデルが存在しない場合
         """
-        if not topic:
-            raise ValueError("Topic cannot be empty")
-
         # Ollamaサーバーの可用性確認（詳細なヘルスチェック）
         health_check = self.perform_health_check()
         if health_check["status"] == "unhealthy":
@@ -577,15 +987,58 @@ class OllamaService:
             )
             raise OllamaServiceError(error_msg)
 
+    def generate_manzai_script(
+        self, topic: str, model_name: str = "gemma3:4b", use_cache: bool = True
+    ) -> List[ScriptLine]:
+        """指定されたトピックの漫才台本を生成
+
+        同じモデルとプロンプトで生成済みの台本があれば、LLMを呼ばずにそれを返す。
+        プロンプトテンプレートを編集するとキーが変わるため、古い台本は使われない。
+        semantic_cache_threshold が設定されている場合は、表記の近いトピックの台本も再利用する。
+
+        Args:
+            topic: 台本のトピック
+            model_name: 使用するLLMモデル名
+            use_cache: Falseの場合は生成済みの台本を使わずに生成し直す
+
+        Returns:
+            生成された台本
+
+        Raises:
+            OllamaServiceError: 台本生成に失敗した場合
+        """
+        if not topic:
+            raise ValueError("Topic cannot be empty")
+
         prompt = self.prompt_loader.load_template("manzai_prompt", topic=topic)
+        key = (model_name, prompt)
+        similar = (
+            (prompt.replace(topic, ""), _topic_vector(topic))
+            if self._semantic_cache_threshold is not None
+            else None
+        )
+        if use_cache:
+            cached = self._cached_script(key, similar)
+            if cached is not None:
+                logger.info(f"Using cached manzai script for topic: {topic}")
+                return [ScriptLine(role=role, text=text) for role, text in cached]
+
+        self._ensure_model_available(model_name)
 
         try:
             logger.info(f"Generating manzai script for topic: {topic} with model: {model_name}")
-            json_response = self.client.generate_json_sync(prompt, model_name)
+            # 可用性は上のヘルスチェックで確認済みなので再確認しない
+            json_response = self.client.generate_json_sync(
+                prompt, model_name, skip_availability_check=True
+            )
 
             script = self._parse_manzai_script(json_response)
             logger.info(f"Successfully generated manzai script with {len(script)} lines")
 
+            # 空の台本は失敗とみなしてキャッシュしない
+            if script and self._script_cache_size > 0:
+                self._store_script(key, similar, script)
+
             return script
 
         except (OllamaServiceError, ValueError):
@@ -596,6 +1049,178 @@ class OllamaService:
             logger.exception(error_message)
             raise OllamaServiceError(error_message)
 
+    def _cached_script(
+        self, key: Tuple[str, str], similar: Optional[Tuple[str, Dict[str, float]]]
+    ) -> Optional[Tuple[Tuple[Role, str], ...]]:
+        """キャッシュから台本を取得
+
+        完全一致がなく、類似検索用の情報が渡された場合は、同じモデル・同じテンプレートで
+        類似度がしきい値以上のトピックのうち最も新しいものの台本を返す。
+
+        Args:
+            key: (モデル名, プロンプト)
+            similar: (テンプレート, トピックのベクトル)。類似トピックを探さない場合はNone
+
+        Returns:
+            キャッシュされた台本。見つからない場合はNone
+        """
+        with self._script_cache_lock:
+            if key not in self._script_cache and similar and similar[1]:
+                template, vector = similar
+                threshold = self._semantic_cache_threshold or 0.0
+                for other_template, other, other_key in reversed(self._semantic_cache):
+                    if (
+                        other_key[0] == key[0]
+                        and other_template == template
+                        and other_key in self._script_cache
+                        and _cosine(vector, other) >= threshold
+                    ):
+                        key = other_key
+                        break
+            cached = self._script_cache.get(key)
+            if cached is not None:
+                self._script_cache.move_to_end(key)
+            return cached
+
+    def _store_script(
+        self,
+        key: Tuple[str, str],
+        similar: Optional[Tuple[str, Dict[str, float]]],
+        script: List[ScriptLine],
+    ) -> None:
+        """生成した台本をキャッシュに保存
+
+        Args:
+            key: (モデル名, プロンプト)
+            similar: (テンプレート, トピックのベクトル)。類似トピックを探さない場合はNone
+            script: 台本
+        """
+        with self._script_cache_lock:
+            self._script_cache[key] = tuple((line.role, line.text) for line in script)
+            self._script_cache.move_to_end(key)
+            if len(self._script_cache) > self._script_cache_size:
+                self._script_cache.popitem(last=False)
+            if similar and similar[1]:
+                # 再生成した場合は同じキーの古い項目を残さない
+                for entry in [entry for entry in self._semantic_cache if entry[2] == key]:
+                    self._semantic_cache.remove(entry)
+                self._semantic_cache.append((similar[0], similar[1], key))
+
+    def invalidate_script_cache(self) -> None:
+        """キャッシュされた台本を破棄"""
+        with self._script_cache_lock:
+            self._script_cache.clear()
+            self._semantic_cache.clear()
+
+    def stream_manzai_script(
+        self, topic: str, model_name: str = "gemma3:4b"
+    ) -> Iterator[ScriptLine]:
+        """指定されたトピックの漫才台本を生成しながら1行ずつ返す
+
+        可用性の確認とプロンプトの作成はこのメソッドの呼び出し時に行い、
+        台本の各行は生成が終わった時点で返す。全体の生成完了を待たずに
+        音声合成などの後続処理を始められる。
+
+        Args:
+            topic: 台本のトピック
+            model_name: 使用するLLMモデル名
+
+        Returns:
+            生成された台本の行を順に返すイテレーター。反復中に生成に失敗した場合は
+            OllamaServiceError を送出する
+
+        Raises:
+            ValueError: トピックが空の場合
+            OllamaServiceError: サーバーまたはモデルが利用できない場合
+        """
+        if not topic:
+            raise ValueError("Topic cannot be empty")
+
+        self._ensure_model_available(model_name)
+        prompt = self.prompt_loader.load_template("manzai_prompt", topic=topic)
+        logger.info(f"Streaming manzai script for topic: {topic} with model: {model_name}")
+        return self._iter_script_lines(prompt, model_name)
+
+    def _iter_script_lines(self, prompt: str, model_name: str) -> Iterator[ScriptLine]:
+        """生成中のテキストから完成した「話者: セリフ」行を順に取り出す
+
+        Args:
+            prompt: プロンプト
+            model_name: 使用するLLMモデル名
+
+        Yields:
+            台本の行
+        """
+        buffer = ""
+        for piece in self.client.generate_text_stream(
+            prompt, model_name, skip_availability_check=True
+        ):
+            buffer += piece
+            # 改行までそろった行だけを解析し、書きかけの行はバッファに残す
+            complete, newline, buffer = buffer.rpartition("\n")
+            if newline:
+                yield from self._script_lines_in(complete)
+        yield from self._script_lines_in(buffer)
+
+    @staticmethod
+    def _script_lines_in(text: str) -> Iterator[ScriptLine]:
+        """テキスト中の「話者: セリフ」行をScriptLineに変換
+
+        Args:
+            text: 完成した行からなるテキスト
+
+        Yields:
+            台本の行
+        """
+        for speaker, content in _SCRIPT_LINE_RE.findall(text):
+            yield ScriptLine(role=_ROLE_MAP.get(speaker, Role.BOKE), text=content)
+
+    def generate_manzai_scripts_batch(
+        self, topics: List[str], model_name: str = "gemma3:4b"
+    ) -> List[List[ScriptLine]]:
+        """複数のトピックの漫才台本を並行して生成
+
+        可用性の確認は最初に一度だけ行い、各トピックの生成リクエストは
+        クライアントのワーカースレッドから共有セッションの接続プール上で同時に送る。
+        同時に送る件数は OLLAMA_NUM_PARALLEL（既定値4）までに制限される。
+
+        Args:
+            topics: 台本のトピックのリスト
+            model_name: 使用するLLMモデル名
+
+        Returns:
+            トピックと同じ順序の台本のリスト
+
+        Raises:
+            ValueError: 空のトピックが含まれる場合
+            OllamaServiceError: 台本生成に失敗した場合
+        """
+        if not all(topics):
+            raise ValueError("Topic cannot be empty")
+
+        self._ensure_model_available(model_name)
+
+        prompts = [
+            self.prompt_loader.load_template("manzai_prompt", topic=topic) for topic in topics
+        ]
+        logger.info(f"Generating {len(prompts)} manzai scripts with model: {model_name}")
+        futures = [
+            self.client.generate_json_async(prompt, model_name, skip_availability_check=True)
+            for prompt in prompts
+        ]
+        try:
+            return [self._parse_manzai_script(future.result()) for future in futures]
+        except (OllamaServiceError, ValueError):
+            raise
+        except Exception as e:
+            error_message = f"Error generating manzai scripts: {e!s}"
+            logger.exception(error_message)
+            raise OllamaServiceError(error_message)
+        finally:
+            # 途中で失敗した場合は未着手の生成リクエストを送らない
+            for future in futures:
+                future.cancel()
+
     def list_models(self) -> List[Dict[str, Any]]:
         """利用可能なモデルのリストを取得
 
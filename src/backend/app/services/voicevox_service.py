@@ -1,16 +1,38 @@
+import contextlib
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, List
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 import requests
-import requests.exceptions
+from flask import Flask
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RequestException, Timeout
 
 from src.backend.app.models.audio import AudioSynthesisResult, SpeechTimingData
 from src.backend.app.models.service import VoiceVoxSpeaker
+from src.backend.app.utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+# requestsに渡すタイムアウト（秒数、または(接続, 読み込み)のタプル）
+TimeoutType = Union[float, Tuple[float, float]]
+
+# フォールバック用の無音データ（1秒間の44.1kHz、16bitのモノラル無音）
+# 符号付き16bit PCMでは0が無音（0x8000は負の最大振幅になる）
+_SILENCE_1S = bytes(2 * 44100)
+
+# サービス停止や過負荷とみなす一時的な通信エラー
+_TRANSIENT_ERRORS = (RequestsConnectionError, Timeout)
+
+# 合成音声をファイルへ書き出す際の読み込み単位（バイト）
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class VoiceVoxServiceError(Exception):
     """VoiceVoxサービスのエラーを表す例外クラス"""
@@ -18,20 +40,176 @@ class VoiceVoxServiceError(Exception):
     pass
 
 
+class VoiceVoxCircuitOpenError(VoiceVoxServiceError):
+    """サーキットブレーカーが開いているため呼び出しを遮断したことを表す例外クラス"""
+
+    pass
+
+
+class _CircuitBreaker:
+    """VoiceVox APIへの呼び出しを保護するサーキットブレーカー
+
+    例外（接続エラー・タイムアウトなど）や5xx応答が続いた場合は回路を開き、
+    sleep_window秒が経過するまでは通信せずに即座に失敗させる。
+    経過後は1件だけ試行（HALF_OPEN）し、成功すれば回路を閉じる。
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        sleep_window: float = 10.0,
+        error_rate_threshold: float = 0.5,
+        window_size: int = 20,
+    ) -> None:
+        """_CircuitBreakerの初期化
+
+        Args:
+            failure_threshold: 回路を開くまでの連続失敗回数
+            sleep_window: 回路を開いてから再試行を許可するまでの秒数
+            error_rate_threshold: 直近window_size件の失敗率がこの値以上なら回路を開く
+            window_size: 失敗率の計算に使う直近の呼び出し件数
+        """
+        self.failure_threshold = failure_threshold
+        self.sleep_window = sleep_window
+        self.error_rate_threshold = error_rate_threshold
+        self.state = self.CLOSED
+        self._consecutive_failures = 0
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def _before_call(self) -> None:
+        """呼び出し可否を判定し、遮断する場合は例外を送出"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.sleep_window:
+                self.state = self.HALF_OPEN
+                return
+            raise VoiceVoxCircuitOpenError("VoiceVox API is unavailable (circuit breaker is open)")
+
+    def _record(self, success: bool) -> None:
+        """呼び出し結果を記録し、状態を更新"""
+        with self._lock:
+            self._outcomes.append(success)
+            if success:
+                self._consecutive_failures = 0
+                if self.state == self.HALF_OPEN:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                return
+
+            self._consecutive_failures += 1
+            error_rate = self._outcomes.count(False) / len(self._outcomes)
+            if (
+                self.state == self.HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+                or (
+                    len(self._outcomes) == self._outcomes.maxlen
+                    and error_rate >= self.error_rate_threshold
+                )
+            ):
+                if self.state != self.OPEN:
+                    logger.warning("VoiceVox circuit breaker opened")
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def call(self, func: Callable[[], requests.Response]) -> requests.Response:
+        """サーキットブレーカー越しにHTTP呼び出しを実行
+
+        Args:
+            func: HTTPリクエストを行いレスポンスを返す関数
+
+        Returns:
+            funcが返したレスポンス
+
+        Raises:
+            VoiceVoxCircuitOpenError: 回路が開いている場合
+        """
+        self._before_call()
+        try:
+            response = func()
+        except Exception:
+            # 接続エラー以外の例外も失敗として記録する（HALF_OPENのまま残さないため）
+            self._record(False)
+            raise
+        self._record(response.status_code < 500)
+        return response
+
+
 class VoiceVoxService:
     """VoiceVoxサービスとの通信を担当するクラス"""
 
-    def __init__(self, base_url: str = "http://localhost:50021") -> None:
+    def __init__(
+        self,
+        base_url: str = "http://localhost:50021",
+        session: Optional[requests.Session] = None,
+        speakers_ttl: float = 300.0,
+        timeout: TimeoutType = (3.05, 30.0),
+        query_cache_size: int = 512,
+    ) -> None:
         """VoiceVoxServiceの初期化
 
         Args:
             base_url: VoiceVoxサービスのベースURL
+            session: 使用するHTTPセッション（省略時はコネクションプール付きのセッションを生成）
+            speakers_ttl: 話者一覧をキャッシュする秒数
+            timeout: 全リクエストに適用するタイムアウト（秒数、または(接続, 読み込み)のタプル）
+            query_cache_size: 音声合成クエリをキャッシュする最大件数
         """
         self.base_url = base_url
+        if session is None:
+            # audio_query → synthesis のように同一ホストへ連続して送るため接続を使い回す
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
+        self._breaker = _CircuitBreaker()
+        # 運用中に調整できるよう公開属性として保持
+        self.timeout = timeout
+        # 定型句の繰り返しで同じクエリを作り直さないよう (テキスト, 話者ID) ごとに保持する
+        # 値は呼び出し側の変更が波及しないようJSONエンコード済みのバイト列
+        self._query_cache_size = query_cache_size
+        self._query_cache: "OrderedDict[Tuple[str, int], bytes]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._engine_version: Optional[str] = None
+        # 複数行の音声合成を並行して実行するためのワーカー
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="voicevox")
+        self._speakers_ttl = speakers_ttl
+        self._speakers_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._speaker_models_cache: Optional[Tuple[float, List[VoiceVoxSpeaker]]] = None
         self.output_dir = os.path.join("audio")
-        os.makedirs(self.output_dir, exist_ok=True)
+        if not os.path.isdir(self.output_dir):
+            os.makedirs(self.output_dir, exist_ok=True)
         logger.info(f"VoiceVoxService initialized with base URL: {base_url}")
 
+    def init_app(self, app: Flask) -> None:
+        """Flaskアプリケーションにこのインスタンスを登録
+
+        接続プールとサーキットブレーカーの状態をリクエスト間で共有するため、
+        アプリケーションごとに1つのインスタンスを使い回す。
+
+        Args:
+            app: 登録先のFlaskアプリケーション
+        """
+        app.extensions["voicevox"] = self
+        app.voicevox_service = self
+
+    def close(self) -> None:
+        """ワーカーを停止し、HTTPセッションを閉じてプール中の接続を解放"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._session.close()
+
+    def invalidate_speakers_cache(self) -> None:
+        """キャッシュされた話者一覧を破棄"""
+        self._speakers_cache = None
+        self._speaker_models_cache = None
+
     def get_fallback_audio(self, text: str) -> bytes:
         """フォールバック用の音声データを生成
 
@@ -43,17 +221,143 @@ class VoiceVoxService:
         """
         logger.warning(f"Using fallback audio for text: {text}")
 
-        # 簡単な無音データを生成（1秒間の44.1kHz、16bitのモノラル無音）
-        sample_rate = 44100
-        duration = 1  # 1秒
-        num_samples = sample_rate * duration
+        return _SILENCE_1S
 
-        # 16bitの無音データを生成（0x8000で中央値を設定）
-        silence_data = bytearray()
-        for _ in range(num_samples):
-            silence_data.extend([0x00, 0x80])  # リトルエンディアンで0x8000を追加
+    @staticmethod
+    def _validate_input(text: str, speaker_id: int) -> None:
+        """音声合成の入力を検証
 
-        return bytes(silence_data)
+        Raises:
+            ValueError: テキストが空の場合、または話者IDが無効な場合
+        """
+        if not text:
+            raise ValueError("text cannot be empty")
+        if not isinstance(speaker_id, int) or speaker_id < 0:
+            raise ValueError("invalid speaker id")
+
+    @staticmethod
+    def _service_error(e: Exception) -> VoiceVoxServiceError:
+        """通信中に発生した例外をVoiceVoxServiceErrorに変換してログに記録"""
+        if isinstance(e, Timeout):
+            error_msg = "Timeout error occurred while communicating with VoiceVox API"
+        elif isinstance(e, RequestsConnectionError):
+            error_msg = "Connection error with VoiceVox API"
+        elif isinstance(e, RequestException):
+            error_msg = f"Error communicating with VoiceVox API: {e!s}"
+        else:
+            error_msg = f"Unexpected error in VoiceVox service: {e!s}"
+        logging.error(error_msg)
+        return VoiceVoxServiceError(error_msg)
+
+    def _post(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        json: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """VoiceVox APIへPOSTし、エラー応答であれば例外を送出
+
+        Args:
+            path: ベースURLからのパス
+            params: クエリパラメータ
+            json: JSONとして送る本文（オプション）
+            stream: Trueの場合はレスポンス本文を逐次読み込む
+
+        Returns:
+            requests.Response: 成功したレスポンス
+        """
+        response = self._breaker.call(
+            lambda: self._session.post(
+                f"{self.base_url}/{path}",
+                params=params,
+                json=json,
+                stream=stream,
+                timeout=self.timeout,
+            )
+        )
+        if response.status_code >= 400:
+            response.close()
+            error_msg = f"VoiceVox API returned error status: {response.status_code}"
+            logging.error(error_msg)
+            raise VoiceVoxServiceError(error_msg)
+        return response
+
+    def _audio_query(self, text: str, speaker_id: int) -> Dict[str, Any]:
+        """音声合成のクエリ（タイミングデータを含む）を作成
+
+        同じテキストと話者IDのクエリは直近 query_cache_size 件までキャッシュされる。
+        """
+        key = (text, speaker_id)
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+        if cached is not None:
+            return json_utils.loads(cached)
+
+        query_data = self._post("audio_query", params={"text": text, "speaker": speaker_id}).json()
+        if self._query_cache_size > 0:
+            with self._query_cache_lock:
+                self._query_cache[key] = json_utils.dumps(query_data)
+                if len(self._query_cache) > self._query_cache_size:
+                    self._query_cache.popitem(last=False)
+        return query_data
+
+    def invalidate_query_cache(self) -> None:
+        """キャッシュされた音声合成クエリを破棄"""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
+    def _synthesis(self, query_data: Dict[str, Any], speaker_id: int) -> bytes:
+        """作成済みのクエリから音声を合成"""
+        return self._post("synthesis", params={"speaker": speaker_id}, json=query_data).content
+
+    def _synthesis_to_file(self, query_data: Dict[str, Any], speaker_id: int, path: str) -> None:
+        """作成済みのクエリから音声を合成し、レスポンスを逐次ファイルへ書き出す
+
+        音声全体をメモリ上に保持しないよう、受信したチャンクをそのまま書き込む。
+        途中で失敗した場合は書きかけのファイルを削除する。
+        """
+        response = self._post(
+            "synthesis", params={"speaker": speaker_id}, json=query_data, stream=True
+        )
+        try:
+            with open(path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            raise
+        finally:
+            response.close()
+
+    @staticmethod
+    def _extract_timing(query_data: Dict[str, Any]) -> Tuple[List[SpeechTimingData], float]:
+        """音声合成クエリからモーラ単位のタイミングデータと合計時間を抽出
+
+        Returns:
+            (タイミングデータのリスト, 合計時間（秒）) のタプル
+        """
+        timing_data = []
+        duration = 0.0
+        for phrase in query_data.get("accent_phrases", ()):
+            for mora in phrase.get("moras", ()):
+                # 母音のみのモーラでは consonant_length が null になる
+                mora_length = (mora.get("consonant_length") or 0.0) + (
+                    mora.get("vowel_length") or 0.0
+                )
+                duration += mora_length
+                timing_data.append(
+                    SpeechTimingData(
+                        start_time=0.0,  # 簡易実装
+                        end_time=mora_length,
+                        phoneme="",  # 簡易実装
+                        text=mora.get("text", ""),
+                    )
+                )
+        return timing_data, duration
 
     def generate_voice(self, text: str, speaker_id: int) -> bytes:
         """テキストから音声を生成します。
@@ -63,54 +367,55 @@ class VoiceVoxService:
             speaker_id (int): 話者ID
 
         Returns:
-            bytes: 生成された音声データ
+            bytes: 生成された音声データ（サーキットブレーカーが開いている場合は無音データ）
 
         Raises:
             ValueError: テキストが空の場合、または話者IDが無効な場合
             VoiceVoxServiceError: VoiceVoxサービスとの通信に失敗した場合
         """
-        if not text:
-            raise ValueError("text cannot be empty")
-        if not isinstance(speaker_id, int) or speaker_id < 0:
-            raise ValueError("invalid speaker id")
+        self._validate_input(text, speaker_id)
 
         try:
-            # 音声合成のクエリを作成
-            query_response = requests.post(
-                f"{self.base_url}/audio_query",
-                params={"text": text, "speaker": speaker_id},
-                timeout=30,  # タイムアウトを30秒に設定
-            )
-            if query_response.status_code >= 400:
-                error_msg = f"VoiceVox API returned error status: {query_response.status_code}"
-                logging.error(error_msg)
-                raise VoiceVoxServiceError(error_msg)
-            query_data = query_response.json()
-
-            # 音声を合成
-            synthesis_response = requests.post(
-                f"{self.base_url}/synthesis",
-                params={"speaker": speaker_id},
-                json=query_data,
-                timeout=30,  # タイムアウトを30秒に設定
-            )
-            if synthesis_response.status_code >= 400:
-                error_msg = f"VoiceVox API returned error status: {synthesis_response.status_code}"
-                logging.error(error_msg)
-                raise VoiceVoxServiceError(error_msg)
-            return synthesis_response.content
-
+            return self._synthesis(self._audio_query(text, speaker_id), speaker_id)
+        except VoiceVoxCircuitOpenError:
+            # サービス停止中はタイムアウトを待たずに無音データで応答する
+            return self.get_fallback_audio(text)
         except Exception as e:
-            if "Timeout" in str(type(e)):
-                error_msg = "Timeout error occurred while communicating with VoiceVox API"
-            elif "ConnectionError" in str(type(e)):
-                error_msg = "Connection error with VoiceVox API"
-            elif "RequestException" in str(type(e)):
-                error_msg = f"Error communicating with VoiceVox API: {e!s}"
-            else:
-                error_msg = f"Unexpected error in VoiceVox service: {e!s}"
-            logging.error(error_msg)
-            raise VoiceVoxServiceError(error_msg)
+            raise self._service_error(e)
+
+    def generate_voice_async(self, text: str, speaker_id: int) -> "Future[bytes]":
+        """音声生成をワーカースレッドで実行
+
+        Args:
+            text (str): 音声化するテキスト
+            speaker_id (int): 話者ID
+
+        Returns:
+            Future[bytes]: 生成された音声データを結果に持つFuture。失敗時は result() が
+            ValueError または VoiceVoxServiceError を送出する
+        """
+        return self._executor.submit(self.generate_voice, text, speaker_id)
+
+    def synthesize_many(self, lines: List[Tuple[str, int]]) -> List[bytes]:
+        """複数のテキストを共有セッションの接続プール上で並行して音声化
+
+        Args:
+            lines (List[Tuple[str, int]]): (テキスト, 話者ID) のリスト
+
+        Returns:
+            List[bytes]: 入力と同じ順序の音声データのリスト
+
+        Raises:
+            ValueError: テキストが空の場合、または話者IDが無効な場合
+            VoiceVoxServiceError: VoiceVoxサービスとの通信に失敗した場合
+        """
+        futures = [self.generate_voice_async(text, speaker_id) for text, speaker_id in lines]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            # 途中で失敗した場合は未着手のリクエストを送らない
+            for future in futures:
+                future.cancel()
 
     def get_timing_data(self, text: str, speaker_id: int = 1) -> Dict[str, Any]:
         """
@@ -127,33 +432,14 @@ class VoiceVoxService:
             ValueError: テキストが空の場合、または話者IDが無効な場合
             VoiceVoxServiceError: VoiceVoxサービスとの通信に失敗した場合
         """
-        if not text:
-            raise ValueError("text cannot be empty")
-        if not isinstance(speaker_id, int) or speaker_id < 0:
-            raise ValueError("invalid speaker id")
+        self._validate_input(text, speaker_id)
 
         try:
-            response = requests.post(
-                f"{self.base_url}/audio_query",
-                params={"text": text, "speaker": speaker_id},
-            )
-            if response.status_code >= 400:
-                error_msg = f"VoiceVox API returned error status: {response.status_code}"
-                logging.error(error_msg)
-                raise VoiceVoxServiceError(error_msg)
-            return response.json()
-
+            return self._audio_query(text, speaker_id)
+        except VoiceVoxCircuitOpenError:
+            raise
         except Exception as e:
-            if "Timeout" in str(type(e)):
-                error_msg = "Timeout error occurred while communicating with VoiceVox API"
-            elif "ConnectionError" in str(type(e)):
-                error_msg = "Connection error with VoiceVox API"
-            elif "RequestException" in str(type(e)):
-                error_msg = f"Error communicating with VoiceVox API: {e!s}"
-            else:
-                error_msg = f"Unexpected error in VoiceVox service: {e!s}"
-            logging.error(error_msg)
-            raise VoiceVoxServiceError(error_msg)
+            raise self._service_error(e)
 
     def synthesize_voice(self, text: str, speaker_id: int = 1) -> AudioSynthesisResult:
         """
@@ -170,43 +456,25 @@ class VoiceVoxService:
             ValueError: テキストが空の場合、または話者IDが無効な場合
             VoiceVoxServiceError: VoiceVoxサービスとの通信に失敗した場合
         """
-        # タイミングデータを取得
-        timing_data_raw = self.get_timing_data(text, speaker_id)
-
-        # 音声データを生成
-        audio_data = self.generate_voice(text, speaker_id)
-
-        # タイミングデータを変換
-        timing_data = []
-        if "accent_phrases" in timing_data_raw:
-            for phrase in timing_data_raw["accent_phrases"]:
-                for mora in phrase.get("moras", []):
-                    consonant_length = mora.get("consonant_length", 0.0)
-                    vowel_length = mora.get("vowel_length", 0.0)
-                    mora_text = mora.get("text", "")
-
-                    timing_data.append(
-                        SpeechTimingData(
-                            start_time=0.0,  # 簡易実装
-                            end_time=consonant_length + vowel_length,
-                            phoneme="",  # 簡易実装
-                            text=mora_text,
-                        )
-                    )
-
-        # ファイル保存（テスト用の仮パス）
-        import uuid
+        self._validate_input(text, speaker_id)
 
         file_path = f"{self.output_dir}/synthesized_{uuid.uuid4().hex[:8]}.wav"
 
-        # 実際のファイル保存
-        with open(file_path, "wb") as f:
-            f.write(audio_data)
+        try:
+            # クエリは一度だけ作成し、音声合成とタイミングデータの両方に使う
+            query_data = self._audio_query(text, speaker_id)
+            self._synthesis_to_file(query_data, speaker_id, file_path)
+        except VoiceVoxCircuitOpenError:
+            raise
+        except Exception as e:
+            raise self._service_error(e)
+
+        timing_data, duration = self._extract_timing(query_data)
 
         return AudioSynthesisResult(
             file_path=file_path,
             timing_data=timing_data,
-            duration=sum(td.end_time for td in timing_data),
+            duration=duration,
             text=text,
             speaker_id=speaker_id,
         )
@@ -217,7 +485,7 @@ class VoiceVoxService:
         Returns:
             Dict[str, Any]: サービスの詳細ステータス情報
         """
-        availability = self.check_availability()
+        availability = self.check_availability(include_speakers=True)
         return {
             "base_url": self.base_url,
             "available": availability["available"],
@@ -248,26 +516,41 @@ class VoiceVoxService:
         """
         利用可能な話者のリストを取得します。
 
+        取得結果は speakers_ttl 秒間キャッシュされる。
+
         Returns:
             List[Dict[str, Any]]: 話者情報のリスト
 
         Raises:
             VoiceVoxServiceError: VoiceVoxサービスとの通信に失敗した場合
         """
+        cache = self._speakers_cache
+        if cache is not None and time.monotonic() - cache[0] < self._speakers_ttl:
+            return list(cache[1])
+
         try:
-            response = requests.get(f"{self.base_url}/speakers")
+            response = self._breaker.call(
+                lambda: self._session.get(f"{self.base_url}/speakers", timeout=self.timeout)
+            )
             if response.status_code >= 400:
                 error_msg = f"VoiceVox API returned error status: {response.status_code}"
                 logging.error(error_msg)
                 raise VoiceVoxServiceError(error_msg)
-            return response.json()
+            speakers = response.json()
+            self._speakers_cache = (time.monotonic(), speakers)
+            return list(speakers)
+        except VoiceVoxCircuitOpenError:
+            raise
+        except RequestsConnectionError:
+            error_msg = "Connection error with VoiceVox API"
+            logging.error(error_msg)
+            raise VoiceVoxServiceError(error_msg)
+        except RequestException as e:
+            error_msg = f"Error communicating with VoiceVox API: {e!s}"
+            logging.error(error_msg)
+            raise VoiceVoxServiceError(error_msg)
         except Exception as e:
-            if "ConnectionError" in str(type(e)):
-                error_msg = "Connection error with VoiceVox API"
-            elif "RequestException" in str(type(e)):
-                error_msg = f"Error communicating with VoiceVox API: {e!s}"
-            else:
-                error_msg = f"Unexpected error in VoiceVox service: {e!s}"
+            error_msg = f"Unexpected error in VoiceVox service: {e!s}"
             logging.error(error_msg)
             raise VoiceVoxServiceError(error_msg)
 
@@ -283,27 +566,29 @@ class VoiceVoxService:
         try:
             # 話者一覧を取得
             speakers_data = self.get_speakers()
-            result = []
-
-            for speaker in speakers_data:
-                speaker_name = speaker.get("name", "")
-                speaker_uuid = speaker.get("speaker_uuid", "")
 
-                for style in speaker.get("styles", []):
-                    style_id = style.get("id", 0)
-                    style_name = style.get("name", "")
-
-                    if style_id > 0:
-                        result.append(
-                            VoiceVoxSpeaker(
-                                id=style_id,
-                                name=speaker_name,
-                                style_id=style_id,
-                                style_name=style_name,
-                            )
-                        )
-
-            return result
+            # 同じ取得結果から変換済みであれば再利用
+            cache = self._speakers_cache
+            models_cache = self._speaker_models_cache
+            if cache is not None and models_cache is not None and models_cache[0] == cache[0]:
+                return list(models_cache[1])
+
+            # スタイルごとに1件へ展開（IDが0以下のスタイルは除外）
+            result = [
+                VoiceVoxSpeaker(
+                    id=style_id,
+                    name=speaker.get("name", ""),
+                    style_id=style_id,
+                    style_name=style.get("name", ""),
+                )
+                for speaker in speakers_data
+                for style in speaker.get("styles", ())
+                if (style_id := style.get("id", 0)) > 0
+            ]
+
+            if cache is not None:
+                self._speaker_models_cache = (cache[0], result)
+            return list(result)
 
         except VoiceVoxServiceError:
             # エラーをそのまま再送出
@@ -313,9 +598,13 @@ class VoiceVoxService:
             logger.exception(error_message)
             raise VoiceVoxServiceError(error_message)
 
-    def check_availability(self) -> Dict[str, Any]:
+    def check_availability(self, include_speakers: bool = False) -> Dict[str, Any]:
         """VoiceVoxサービスの可用性と情報を確認
 
+        Args:
+            include_speakers: Trueの場合は話者一覧も取得して話者数を含める
+                （Falseの場合 "speakers" は0のまま）
+
         Returns:
             状態情報の辞書 {"available": bool, "speakers": int, "error": Optional[str]}
         """
@@ -328,35 +617,39 @@ class VoiceVoxService:
         }
 
         try:
-            import time
-
             start_time = time.time()
 
             # バージョン情報を取得
-            version_resp = requests.get(f"{self.base_url}/version", timeout=5)
+            version_resp = self._breaker.call(
+                lambda: self._session.get(f"{self.base_url}/version", timeout=self.timeout)
+            )
             version_resp.raise_for_status()
             result["version"] = version_resp.text
-
-            # 話者情報を取得
-            speakers = self.list_speakers()
-
-            # 情報を設定
-            result["available"] = True
-            result["speakers"] = len(speakers)
+            if version_resp.text != self._engine_version:
+                # エンジンが更新された場合は以前のクエリを使わない
+                self._engine_version = version_resp.text
+                self.invalidate_query_cache()
 
             # 応答時間を計算（ミリ秒）
             end_time = time.time()
             result["response_time_ms"] = int((end_time - start_time) * 1000)
 
+            # 話者情報を取得（キャッシュ済みであれば通信しない）
+            if include_speakers:
+                result["speakers"] = len(self.list_speakers())
+
+            result["available"] = True
+
+        except VoiceVoxCircuitOpenError as e:
+            result["error"] = str(e)
+        except _TRANSIENT_ERRORS as e:
+            result["error"] = f"Connection error: {e!s}"
+            logger.warning(f"VoiceVox service connection error: {e!s}")
+        except RequestException as e:
+            result["error"] = f"Request error: {e!s}"
+            logger.warning(f"VoiceVox service request error: {e!s}")
         except Exception as e:
-            if "ConnectionError" in str(type(e)) or "Timeout" in str(type(e)):
-                result["error"] = f"Connection error: {e!s}"
-                logger.warning(f"VoiceVox service connection error: {e!s}")
-            elif "RequestException" in str(type(e)):
-                result["error"] = f"Request error: {e!s}"
-                logger.warning(f"VoiceVox service request error: {e!s}")
-            else:
-                result["error"] = f"Unexpected error: {e!s}"
-                logger.warning(f"Unexpected error checking VoiceVox availability: {e!s}")
+            result["error"] = f"Unexpected error: {e!s}"
+            logger.warning(f"Unexpected error checking VoiceVox availability: {e!s}")
 
         return result
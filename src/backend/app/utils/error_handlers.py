@@ -1,27 +1,58 @@
 """API Error handlers for the Flask application."""
 
+import logging
 from functools import wraps
-from typing import Any, Callable, Tuple, Union
+from typing import Any, Callable, Dict, List, Union
 
-from flask import Flask, Response, jsonify
+from flask import Flask, Response
 from pydantic import ValidationError
+from werkzeug.exceptions import HTTPException
 
+from src.backend.app.utils import json_utils
+from src.backend.app.utils.exceptions import APIError
 
-class APIError(Exception):
-    """Custom API error class for handling API errors."""
+__all__ = [
+    "APIError",
+    "api_error_handler",
+    "handle_pydantic_validation_error",
+    "register_error_handlers",
+]
 
-    def __init__(self, message: str, status_code: int = 400, details: Any = None) -> None:
-        """Initialize the API error.
+logger = logging.getLogger(__name__)
 
-        Args:
-            message: Error message.
-            status_code: HTTP status code.
-            details: 詳細エラー情報（オプション）
-        """
-        super().__init__(message)
-        self.message = message
-        self.status_code = status_code
-        self.details = details
+# 想定外のエラー時に返す本文（例外の内容はクライアントに返さずログにのみ残す）
+_UNEXPECTED_ERROR_BODY = json_utils.dumps({"error": "Unexpected error"})
+
+
+def _json(payload: Any, status: int) -> Response:
+    """ペイロードをJSONレスポンスに変換する
+
+    Args:
+        payload: レスポンス本文にするオブジェクト
+        status: HTTPステータスコード
+
+    Returns:
+        JSONレスポンス
+    """
+    # バリデーションエラーのctxに含まれる例外オブジェクトなどは文字列化する
+    return Response(
+        json_utils.dumps(payload, default=str), status=status, mimetype="application/json"
+    )
+
+
+def _api_error_response(e: APIError) -> Response:
+    """APIErrorをJSONレスポンスに変換する
+
+    Args:
+        e: APIErrorインスタンス
+
+    Returns:
+        エラーレスポンス
+    """
+    payload = {"error": e.message}
+    if e.details:
+        payload["details"] = e.details
+    return _json(payload, e.status_code)
 
 
 def api_error_handler(f: Callable) -> Callable:
@@ -35,58 +66,49 @@ def api_error_handler(f: Callable) -> Callable:
     """
 
     @wraps(f)
-    def decorated(*args, **kwargs) -> Union[Tuple[Response, int], Any]:
+    def decorated(*args, **kwargs) -> Union[Response, Any]:
+        # バリデーションエラーや想定外の例外は register_error_handlers で
+        # 登録したアプリケーション全体のハンドラが処理する
         try:
             return f(*args, **kwargs)
         except APIError as e:
-            response = {"error": e.message}
-            if e.details:
-                response["details"] = e.details
-            return jsonify(response), e.status_code
-        except ValidationError as e:
-            # Pydantic v2のバリデーションエラーを処理
-            error_details = []
-            for error in e.errors():
-                error_detail = {
-                    "loc": error.get("loc", []),
-                    "msg": error.get("msg", ""),
-                    "type": error.get("type", ""),
-                    "input": error.get("input", None),
-                    "ctx": error.get("ctx", {}),
-                }
-                if error.get("url"):
-                    error_detail["url"] = error["url"]
-                error_details.append(error_detail)
-            return jsonify({"error": "Validation error", "details": error_details}), 400
-        except Exception as e:
-            return jsonify({"error": f"Unexpected error: {e!s}"}), 500
+            return _api_error_response(e)
 
     return decorated
 
 
-def handle_pydantic_validation_error(e: ValidationError) -> Tuple[Response, int]:
-    """Pydanticのバリデーションエラーをレスポンスに変換する
+def _format_validation_errors(e: ValidationError) -> List[Dict[str, Any]]:
+    """Pydanticのバリデーションエラーをレスポンス用の辞書のリストに変換する
 
     Args:
         e: ValidationErrorインスタンス
 
     Returns:
-        エラーレスポンスとステータスコード
+        エラー詳細のリスト
     """
-    error_details = []
-    for error in e.errors():
-        error_detail = {
+    return [
+        {
             "loc": error.get("loc", []),
             "msg": error.get("msg", ""),
             "type": error.get("type", ""),
             "input": error.get("input", None),
             "ctx": error.get("ctx", {}),
+            **({"url": error["url"]} if error.get("url") else {}),
         }
-        if error.get("url"):
-            error_detail["url"] = error["url"]
-        error_details.append(error_detail)
+        for error in e.errors()
+    ]
+
+
+def handle_pydantic_validation_error(e: ValidationError) -> Response:
+    """Pydanticのバリデーションエラーをレスポンスに変換する
 
-    return jsonify({"error": "Validation error", "details": error_details}), 400
+    Args:
+        e: ValidationErrorインスタンス
+
+    Returns:
+        エラーレスポンス
+    """
+    return _json({"error": "Validation error", "details": _format_validation_errors(e)}, 400)
 
 
 def register_error_handlers(app: Flask) -> None:
@@ -97,29 +119,35 @@ def register_error_handlers(app: Flask) -> None:
     """
 
     @app.errorhandler(400)
-    def bad_request(e) -> Tuple[Response, int]:
+    def bad_request(e) -> Response:
         """Handle bad request errors."""
-        return jsonify({"error": str(e)}), 400
+        return _json({"error": str(e)}, 400)
 
     @app.errorhandler(404)
-    def not_found(e) -> Tuple[Response, int]:
+    def not_found(e) -> Response:
         """Handle not found errors."""
-        return jsonify({"error": "Resource not found"}), 404
+        return _json({"error": "Resource not found"}, 404)
 
     @app.errorhandler(500)
-    def internal_server_error(e) -> Tuple[Response, int]:
+    def internal_server_error(e) -> Response:
         """Handle internal server errors."""
-        return jsonify({"error": "Internal server error"}), 500
+        return _json({"error": "Internal server error"}, 500)
 
     @app.errorhandler(APIError)
-    def handle_api_error(e: APIError) -> Tuple[Response, int]:
+    def handle_api_error(e: APIError) -> Response:
         """Handle custom API errors."""
-        response = {"error": e.message}
-        if e.details:
-            response["details"] = e.details
-        return jsonify(response), e.status_code
+        return _api_error_response(e)
 
     @app.errorhandler(ValidationError)
-    def handle_validation_error(e: ValidationError) -> Tuple[Response, int]:
+    def handle_validation_error(e: ValidationError) -> Response:
         """Handle Pydantic validation errors."""
         return handle_pydantic_validation_error(e)
+
+    @app.errorhandler(Exception)
+    def handle_unexpected_error(e: Exception) -> Union[HTTPException, Response]:
+        """Handle unexpected errors without exposing their details."""
+        # 404や405などのHTTPエラーは通常の処理に任せる
+        if isinstance(e, HTTPException):
+            return e
+        logger.exception("Unexpected error while handling request")
+        return Response(_UNEXPECTED_ERROR_BODY, status=500, mimetype="application/json")
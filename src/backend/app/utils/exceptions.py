@@ -8,6 +8,10 @@ from typing import Any
 class BaseAppException(Exception):
     """アプリケーションの基本例外クラス"""
 
+    # 属性をスロットに置き、インスタンスごとの__dict__を生成しないようにする
+    # （サブクラスも__slots__を宣言しないと__dict__が使われる）
+    __slots__ = ("code", "details", "message")
+
     def __init__(self, message: str, code: str | None = None, details: Any = None) -> None:
         self.message = message
         self.code = code or "APP_ERROR"
@@ -18,6 +22,8 @@ class BaseAppException(Exception):
 class ValidationError(BaseAppException):
     """入力バリデーションエラー"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Any = None) -> None:
         super().__init__(message, "VALIDATION_ERROR", details)
 
@@ -25,7 +31,9 @@ class ValidationError(BaseAppException):
 class APIError(BaseAppException):
     """API関連のエラー"""
 
-    def __init__(self, message: str, status_code: int, details: Any = None) -> None:
+    __slots__ = ("status_code",)
+
+    def __init__(self, message: str, status_code: int = 400, details: Any = None) -> None:
         self.status_code = status_code
         super().__init__(message, f"API_ERROR_{status_code}", details)
 
@@ -33,6 +41,8 @@ class APIError(BaseAppException):
 class ContentTypeError(APIError):
     """不適切なContent-Typeエラー"""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Unsupported Media Type", details: Any = None) -> None:
         super().__init__(message, 415, details)
 
@@ -40,5 +50,7 @@ class ContentTypeError(APIError):
 class ModelServiceError(BaseAppException):
     """モデルサービス関連のエラー"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Any = None) -> None:
         super().__init__(message, "MODEL_SERVICE_ERROR", details)
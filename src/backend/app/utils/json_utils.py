@@ -0,0 +1,74 @@
+"""
+JSONのエンコード・デコードを行うユーティリティモジュール
+
+orjson がインストールされている場合はそちらを使い、なければ ujson、それもなければ
+標準ライブラリの json を使う。どの場合もデコードエラーは json.JSONDecodeError
+（またはそのサブクラス）として送出される。
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson は任意の依存パッケージ
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - ujson は任意の依存パッケージ
+    ujson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """JSON文字列またはバイト列をデコード
+
+    Args:
+        data: デコードするJSONデータ
+
+    Returns:
+        デコードされたPythonオブジェクト
+
+    Raises:
+        json.JSONDecodeError: JSONとして不正な場合
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    if ujson is not None:
+        try:
+            return ujson.loads(data)
+        except ValueError as e:
+            # ujson の例外は json.JSONDecodeError ではないため、呼び出し元に合わせて変換する
+            doc = data if isinstance(data, str) else bytes(data).decode("utf-8", "replace")
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """オブジェクトをUTF-8のJSONバイト列にエンコード
+
+    Args:
+        obj: エンコードするオブジェクト
+        pretty: Trueの場合は2スペースでインデントする
+        default: JSONに変換できないオブジェクトを変換する関数（オプション）
+
+    Returns:
+        JSONバイト列
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if pretty else None)
+    if ujson is not None:
+        return ujson.dumps(
+            obj,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            indent=2 if pretty else 0,
+            default=default,
+        ).encode("utf-8")
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=default).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default).encode(
+        "utf-8"
+    )
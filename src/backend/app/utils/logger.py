@@ -2,8 +2,12 @@
 Logging utility for the application with emoji support and structured logging
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import List
 
 # Emojiとログレベルのマッピング
 EMOJI_MAP = {
@@ -18,13 +22,50 @@ EMOJI_MAP = {
 }
 
 
-class EmojiFormatter(logging.Formatter):
-    """カスタムフォーマッタでemoji付きログを生成"""
+# 未定義のログレベルに使うEmoji
+DEFAULT_EMOJI = "📌"
 
-    def format(self, record):
-        emoji = EMOJI_MAP.get(record.levelname, "📌")
-        record.emoji = emoji
-        return super().format(record)
+_base_record_factory = logging.getLogRecordFactory()
+
+
+def _emoji_record_factory(*args, **kwargs) -> logging.LogRecord:
+    """ログレコードの生成時にemoji属性を付与するファクトリ"""
+    record = _base_record_factory(*args, **kwargs)
+    record.emoji = EMOJI_MAP.get(record.levelname, DEFAULT_EMOJI)
+    return record
+
+
+# フォーマットのたびにEmojiを引き直さないよう、レコード生成時に一度だけ付与する
+logging.setLogRecordFactory(_emoji_record_factory)
+
+# ログの書き込みを担当するバックグラウンドのリスナー（GCされないよう保持する）
+_listeners: List[QueueListener] = []
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """終了時にキューに残ったログを書き出してリスナーを停止"""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def queue_handler(*handlers: logging.Handler) -> QueueHandler:
+    """出力をバックグラウンドのスレッドに任せるハンドラを作成
+
+    呼び出し元のスレッドはレコードをキューに積むだけにし、書式化と
+    書き込みは渡したハンドラがリスナーのスレッドで行う。
+
+    Args:
+        *handlers: 実際に出力を行うハンドラ（それぞれのログレベルが適用される）
+
+    Returns:
+        ロガーに追加するQueueHandler
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+    return QueueHandler(log_queue)
 
 
 def setup_logger(name: str = __name__) -> logging.Logger:
@@ -42,12 +83,15 @@ def setup_logger(name: str = __name__) -> logging.Logger:
 
     # ログ出力フォーマットの定義
     fmt = "%(emoji)s %(asctime)s [%(name)s] %(levelname)s: %(message)s"
-    formatter = EmojiFormatter(fmt, datefmt="%Y-%m-%d %H:%M:%S")
+    # 他のファクトリで生成されたレコードでも書式化できるようemojiの既定値を設定
+    formatter = logging.Formatter(
+        fmt, datefmt="%Y-%m-%d %H:%M:%S", defaults={"emoji": DEFAULT_EMOJI}
+    )
 
-    # コンソール出力用ハンドラ
+    # コンソール出力用ハンドラ（書き込みはリスナーのスレッドで行う）
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    logger.addHandler(queue_handler(console_handler))
 
     return logger
 
@@ -2,14 +2,78 @@
 プロンプトテンプレートをロードするユーティリティモジュール
 """
 
-import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import string
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
+from src.backend.app.utils import json_utils
+
 logger = logging.getLogger(__name__)
 
+# プロンプトファイルを並行して読み込む際の最大ワーカー数
+_MAX_LOAD_WORKERS = 8
+
+
+def _load_json(path: str) -> Dict[str, Any]:
+    """JSONファイルをバイト列のまま読み込んでデコード"""
+    with open(path, "rb") as f:
+        return json_utils.loads(f.read())
+
+
+# テンプレートを (リテラル文字列, 変数名) の組に分解したもの
+_TemplateParts = Tuple[Tuple[str, Optional[str]], ...]
+
+# テンプレートファイルのパスごとに (st_mtime_ns, st_size, テンプレート文字列, 分解結果) を保持する
+_TEMPLATE_CACHE: Dict[str, Tuple[int, int, str, Optional[_TemplateParts]]] = {}
+
+
+def _compile_template(template: str) -> Optional[_TemplateParts]:
+    """テンプレートを事前に分解する
+
+    書式指定や変換、属性・インデックス参照を含む場合は str.format に任せるため None を返す。
+
+    Raises:
+        ValueError: テンプレートの書式が不正な場合
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+def _read_template(json_path: str, txt_path: str) -> Tuple[str, Optional[_TemplateParts]]:
+    """テンプレート文字列とその分解結果を読み込む
+
+    JSONプロンプトがあればそちらを優先する。ファイルの更新時刻とサイズが
+    前回と同じ場合はファイルを開かずにキャッシュを返す。
+
+    Raises:
+        FileNotFoundError: どちらのファイルも存在しない場合
+        ValueError: テンプレートの書式が不正な場合
+    """
+    try:
+        path, st = json_path, os.stat(json_path)
+    except FileNotFoundError:
+        path, st = txt_path, os.stat(txt_path)
+
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3]
+
+    if path == json_path:
+        template = _load_json(path).get("template", "")
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            template = f.read()
+    parts = _compile_template(template)
+    _TEMPLATE_CACHE[path] = (st.st_mtime_ns, st.st_size, template, parts)
+    return template, parts
+
 
 class PromptTemplateNotFoundError(Exception):
     """プロンプトテンプレートが見つからない場合のエラー"""
@@ -33,36 +97,35 @@ class PromptLoader:
         self.templates_dir = templates_dir or os.path.join(base_dir, "templates")
         os.makedirs(self.prompts_dir, exist_ok=True)
         os.makedirs(self.templates_dir, exist_ok=True)
+        # ファイルパスは呼び出しごとにos.path.joinせず、区切り文字付きの接頭辞に連結する
+        self._prompts_prefix = os.path.join(self.prompts_dir, "")
+        self._templates_prefix = os.path.join(self.templates_dir, "")
 
     def get_all_prompts(self) -> List[Dict[str, Any]]:
         """全プロンプトを取得"""
-        prompts = []
-        for filename in os.listdir(self.prompts_dir):
-            if filename.endswith(".json"):
-                with open(os.path.join(self.prompts_dir, filename), "r", encoding="utf-8") as f:
-                    prompt = json.load(f)
-                    prompts.append(prompt)
-        return prompts
+        with os.scandir(self.prompts_dir) as it:
+            paths = [e.path for e in it if e.name.endswith(".json")]
+
+        # ファイルが複数ある場合は読み込みを並行させてI/O待ちを重ねる
+        if len(paths) <= 1:
+            return [_load_json(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(paths))) as executor:
+            return list(executor.map(_load_json, paths))
 
     def get_prompt_by_id(self, prompt_id: str) -> Optional[Dict[str, Any]]:
         """IDでプロンプトを取得"""
         try:
-            with open(
-                os.path.join(self.prompts_dir, f"{prompt_id}.json"),
-                "r",
-                encoding="utf-8",
-            ) as f:
-                return json.load(f)
+            return _load_json(f"{self._prompts_prefix}{prompt_id}.json")
         except FileNotFoundError:
             return None
 
     def create_prompt(self, prompt_data: Dict[str, Any]) -> Dict[str, Any]:
         """新しいプロンプトを作成"""
-        prompt_id = str(uuid4())
+        prompt_id = uuid4().hex
         prompt_data["id"] = prompt_id
 
-        with open(os.path.join(self.prompts_dir, f"{prompt_id}.json"), "w", encoding="utf-8") as f:
-            json.dump(prompt_data, f, ensure_ascii=False, indent=2)
+        with open(f"{self._prompts_prefix}{prompt_id}.json", "wb") as f:
+            f.write(json_utils.dumps(prompt_data, pretty=True))
 
         return prompt_data
 
@@ -80,22 +143,22 @@ class PromptLoader:
             PromptTemplateNotFoundError: テンプレートファイルが見つからない場合
         """
         # まずJSONプロンプトを探す
-        json_path = os.path.join(self.prompts_dir, f"{template_name}.json")
-        txt_path = os.path.join(self.templates_dir, f"{template_name}.txt")
+        json_path = f"{self._prompts_prefix}{template_name}.json"
+        txt_path = f"{self._templates_prefix}{template_name}.txt"
 
         try:
-            # JSONプロンプトがある場合はそちらを優先
-            if os.path.exists(json_path):
-                with open(json_path, "r", encoding="utf-8") as f:
-                    prompt_data = json.load(f)
-                    template = prompt_data.get("template", "")
-            # なければテキストテンプレートを使用
-            else:
-                with open(txt_path, "r", encoding="utf-8") as f:
-                    template = f.read()
-
-            # 変数を埋め込む
-            return template.format(**kwargs)
+            # JSONプロンプトがある場合はそちらを優先し、なければテキストテンプレートを使用
+            template, parts = _read_template(json_path, txt_path)
+
+            # 変数を埋め込む（分解済みの場合はテンプレートを再解析しない）
+            if parts is None:
+                return template.format(**kwargs)
+            return "".join(
+                [
+                    literal if field is None else literal + format(kwargs[field])
+                    for literal, field in parts
+                ]
+            )
 
         except FileNotFoundError:
             error_message = f"プロンプトテンプレートが見つかりません: {template_name}"
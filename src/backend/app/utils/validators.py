@@ -10,9 +10,18 @@ import re
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator
 from werkzeug.datastructures import FileStorage
 
+# プロンプト名に使用できる文字（英数字、アンダースコア、ハイフン）
+_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+\Z")
+# ファイル名に使用できない文字
+_SANITIZE_RE = re.compile(r"[^\w\.-]")
+# アップロードを許可するモデルファイルの拡張子
+_MODEL_FILE_EXTENSIONS = (".model3.json", ".zip")
+# アップロードを許可するモデルファイルの最大サイズ（50MB）
+_MAX_MODEL_FILE_BYTES = 50 * 1024 * 1024
+
 
 class ModelType(str, Enum):
     """モデルタイプの列挙型"""
@@ -50,10 +59,11 @@ class PromptData(BaseModel):
     @field_validator("name")
     @classmethod
     def validate_name_format(cls, v: str) -> str:
-        """プロンプト名のフォーマットを検証"""
-        if not v.strip():
-            raise ValueError("プロンプト名は空にできません")
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+        """プロンプト名が空でなく、許可された文字のみで構成されることを検証"""
+        if not _NAME_RE.match(v):
+            # 空白のみの名前は文字種の誤りとは別のメッセージにする
+            if not v.strip():
+                raise ValueError("プロンプト名は空にできません")
             raise ValueError(
                 "プロンプト名は英数字、アンダースコア、ハイフンのみを含むことができます"
             )
@@ -67,14 +77,6 @@ class PromptData(BaseModel):
             raise ValueError("プロンプト内容は空にできません")
         return v
 
-    @field_validator("tags", each_item=True)
-    @classmethod
-    def tags_must_be_strings(cls, v: str) -> str:
-        """各タグが文字列であることを検証"""
-        if not isinstance(v, str):
-            raise ValueError("各タグは文字列である必要があります")
-        return v
-
 
 class ScriptParams(BaseModel):
     """スクリプト生成パラメータのバリデーション用モデル"""
@@ -107,9 +109,9 @@ def validate_model_data(data: Dict[str, Any]) -> Tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     try:
-        ModelData(**data)
+        ModelData.model_validate(data)
         return True, ""
-    except Exception as e:
+    except ValidationError as e:
         return False, str(e)
 
 
@@ -124,9 +126,9 @@ def validate_prompt_data(data: Dict[str, Any]) -> Tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     try:
-        PromptData(**data)
+        PromptData.model_validate(data)
         return True, ""
-    except Exception as e:
+    except ValidationError as e:
         return False, str(e)
 
 
@@ -141,9 +143,9 @@ def validate_script_params(data: Dict[str, Any]) -> Tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     try:
-        ScriptParams(**data)
+        ScriptParams.model_validate(data)
         return True, ""
-    except Exception as e:
+    except ValidationError as e:
         return False, str(e)
 
 
@@ -168,18 +170,19 @@ def validate_model_file(file: FileStorage) -> Tuple[bool, str]:
         return False, "No file provided"
 
     # Check file extension
-    allowed_extensions = [".model3.json", ".zip"]
-    filename = file.filename or ""  # Ensure filename is not None
-    file_ext = os.path.splitext(filename)[-1].lower()
-
-    if file_ext not in allowed_extensions:
+    # os.path.splitext は ".model3.json" を ".json" と判定してしまうため、末尾で直接比較する
+    filename = (file.filename or "").lower()  # Ensure filename is not None
+    if not filename.endswith(_MODEL_FILE_EXTENSIONS):
+        file_ext = "." + filename.rpartition(".")[2] if "." in filename else ""
         return (
             False,
-            f"Invalid file extension: {file_ext}. Must be one of {allowed_extensions}",
+            f"Invalid file extension: {file_ext}. Must be one of {list(_MODEL_FILE_EXTENSIONS)}",
         )
 
     # Check file size (max 50MB)
-    if file.content_length > 50 * 1024 * 1024:  # 50MB in bytes
+    # チャンク転送などでサイズが不明な場合はここでは判定しない
+    content_length = file.content_length
+    if content_length is not None and content_length > _MAX_MODEL_FILE_BYTES:
         return False, "File too large. Maximum size is 50MB"
 
     return True, ""
@@ -196,7 +199,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove path separators and ensure only allowed characters
-    sanitized = re.sub(r"[^\w\.-]", "_", os.path.basename(filename))
+    sanitized = _SANITIZE_RE.sub("_", os.path.basename(filename))
 
     # Ensure it's not empty and doesn't start with a period
     if not sanitized or sanitized.startswith("."):
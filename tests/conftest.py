@@ -1,3 +1,9 @@
+import os
+
+# Keep test runs from writing the Ollama client log file into the working tree.
+# Set before importing the app package, which creates an app (and an Ollama client) on import.
+os.environ.setdefault("OLLAMA_LOG_DIR", "")
+
 import pytest
 
 from src.backend.app import create_app
@@ -1,9 +1,13 @@
 """Test the API endpoints."""
 
 import json
-from unittest.mock import MagicMock
+import threading
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
 
 import pytest
+from flask import Flask
+from pydantic import BaseModel, field_validator
 
 # Import the relevant components
 from src.backend.app import create_app
@@ -15,6 +19,14 @@ from src.backend.app.services.voicevox_service import (
     VoiceVoxService,
     VoiceVoxServiceError,
 )
+from src.backend.app.utils.error_handlers import api_error_handler, register_error_handlers
+
+
+def _done(value):
+    """Return a future that has already completed with the given value."""
+    future = Future()
+    future.set_result(value)
+    return future
 
 
 @pytest.fixture
@@ -53,6 +65,13 @@ def app_with_mocks():
     return app, mock_ollama, mock_voicevox, mock_audio_manager
 
 
+def test_voicevox_service_registered_once_per_app():
+    """Test that the app keeps a single shared VoiceVoxService."""
+    app = create_app(TestConfig())
+    assert isinstance(app.voicevox_service, VoiceVoxService)
+    assert app.extensions["voicevox"] is app.voicevox_service
+
+
 @pytest.fixture
 def client(app_with_mocks):
     """Create test client."""
@@ -91,6 +110,56 @@ def test_detailed_status(client, app_with_mocks):
     mock_voicevox.get_detailed_status.assert_called_once()
 
 
+def test_detailed_status_cached(client, app_with_mocks):
+    """Test that repeated polls reuse the cached status unless force=1 is given."""
+    _, mock_ollama, mock_voicevox, _ = app_with_mocks
+
+    first = client.get("/api/detailed-status")
+    second = client.get("/api/detailed-status")
+    assert first.data == second.data
+    mock_ollama.get_detailed_status.assert_called_once()
+
+    forced = client.get("/api/detailed-status?force=1")
+    assert forced.status_code == 200
+    assert forced.mimetype == "application/json"
+    assert mock_ollama.get_detailed_status.call_count == 2
+    assert mock_voicevox.get_detailed_status.call_count == 2
+
+
+def test_detailed_status_queries_services_concurrently(client, app_with_mocks):
+    """Test that the Ollama and VoiceVox status calls overlap."""
+    _, mock_ollama, mock_voicevox, _ = app_with_mocks
+    # Each call waits for the other, so a serial implementation would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def status():
+        barrier.wait()
+        return {"available": True}
+
+    mock_ollama.get_detailed_status.side_effect = status
+    mock_voicevox.get_detailed_status.side_effect = status
+
+    response = client.get("/api/detailed-status?force=1")
+
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data["ollama"] == {"available": True}
+    assert data["voicevox"] == {"available": True}
+
+
+def test_psutil_sample_throttled():
+    """Test that memory and disk usage are sampled at most once per interval."""
+    from src.backend.app.routes import api
+
+    with patch.object(api, "_psutil_cache", None), patch.object(api, "psutil") as mock_psutil:
+        first = api._psutil_sample()
+        second = api._psutil_sample()
+
+    assert first == second
+    mock_psutil.virtual_memory.assert_called_once()
+    mock_psutil.disk_usage.assert_called_once_with("/")
+
+
 def test_generate_endpoint_success(client, app_with_mocks):
     """Test successful script generation endpoint."""
     _, mock_ollama, mock_voicevox, mock_audio_manager = app_with_mocks
@@ -101,7 +170,7 @@ def test_generate_endpoint_success(client, app_with_mocks):
         ScriptLine(role=Role.BOKE, text="どうも"),
     ]
     mock_ollama.generate_manzai_script.return_value = mock_script
-    mock_voicevox.synthesize_voice.side_effect = [b"audio1", b"audio2"]
+    mock_voicevox.synthesize_many.return_value = [b"audio1", b"audio2"]
     mock_audio_manager.save_audio.side_effect = ["audio1.wav", "audio2.wav"]
 
     # Call endpoint
@@ -119,11 +188,111 @@ def test_generate_endpoint_success(client, app_with_mocks):
     assert data["script"][0]["audio_file"] == "audio1.wav"
 
     # Verify service calls
-    mock_ollama.generate_manzai_script.assert_called_once_with("テスト", "gemma3:4b")
-    assert mock_voicevox.synthesize_voice.call_count == 2
+    mock_ollama.generate_manzai_script.assert_called_once_with(
+        "テスト", "gemma3:4b", use_cache=True
+    )
+    mock_voicevox.synthesize_many.assert_called_once_with([("こんにちは", 1), ("どうも", 2)])
     assert mock_audio_manager.save_audio.call_count == 2
 
 
+def test_generate_endpoint_no_cache(client, app_with_mocks):
+    """Test that no_cache asks the service to generate a fresh script."""
+    _, mock_ollama, mock_voicevox, _ = app_with_mocks
+    mock_ollama.generate_manzai_script.return_value = []
+    mock_voicevox.synthesize_many.return_value = []
+
+    response = client.post("/api/generate", json={"topic": "テスト", "no_cache": True})
+
+    assert response.status_code == 200
+    assert mock_ollama.generate_manzai_script.call_args.kwargs == {"use_cache": False}
+
+
+def test_generate_endpoint_saves_audio_in_script_order(client, app_with_mocks):
+    """Test that synthesized audio is saved under each line's position in the script."""
+    _, mock_ollama, mock_voicevox, mock_audio_manager = app_with_mocks
+
+    mock_ollama.generate_manzai_script.return_value = [
+        ScriptLine(role=Role.TSUKKOMI, text="こんにちは"),
+        ScriptLine(role=Role.BOKE, text="どうも"),
+    ]
+    mock_voicevox.synthesize_many.side_effect = lambda lines: [
+        f"audio-{text}".encode() for text, _ in lines
+    ]
+    mock_audio_manager.save_audio.side_effect = lambda audio, name: f"{name}.wav"
+
+    response = client.post("/api/generate", json={"topic": "テスト"})
+
+    assert response.status_code == 200
+    assert [line["audio_file"] for line in json.loads(response.data)["script"]] == [
+        "script_0.wav",
+        "script_1.wav",
+    ]
+    mock_audio_manager.save_audio.assert_any_call("audio-どうも".encode(), "script_1")
+
+
+def test_generate_batch_endpoint(client, app_with_mocks):
+    """Test batch script generation and its input validation."""
+    _, mock_ollama, _, _ = app_with_mocks
+    mock_ollama.generate_manzai_scripts_batch.return_value = [
+        [ScriptLine(role=Role.TSUKKOMI, text="猫の話")],
+        [ScriptLine(role=Role.BOKE, text="犬の話")],
+    ]
+
+    response = client.post("/api/generate-batch", json={"topics": ["猫", " 犬 "], "model": "m"})
+
+    assert response.status_code == 200
+    assert json.loads(response.data)["scripts"] == [
+        [{"role": "TSUKKOMI", "text": "猫の話"}],
+        [{"role": "BOKE", "text": "犬の話"}],
+    ]
+    mock_ollama.generate_manzai_scripts_batch.assert_called_once_with(["猫", "犬"], "m")
+
+    assert client.post("/api/generate-batch", json={"topics": []}).status_code == 400
+    assert client.post("/api/generate-batch", json={"topics": ["猫", ""]}).status_code == 400
+
+
+def test_generate_stream_endpoint(client, app_with_mocks):
+    """Test that streamed script lines are sent as SSE events with their audio files."""
+    _, mock_ollama, mock_voicevox, mock_audio_manager = app_with_mocks
+    mock_ollama.stream_manzai_script.return_value = iter(
+        [
+            ScriptLine(role=Role.TSUKKOMI, text="こんにちは"),
+            ScriptLine(role=Role.BOKE, text="どうも"),
+        ]
+    )
+    mock_voicevox.generate_voice_async.side_effect = lambda text, speaker_id: _done(text.encode())
+    mock_audio_manager.save_audio.side_effect = lambda audio, name: f"{name}.wav"
+
+    response = client.post("/api/generate-stream", json={"topic": "テスト", "model": "m"})
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = response.get_data(as_text=True).strip().split("\n\n")
+    assert [json.loads(event.split("data: ", 1)[1]) for event in events[:2]] == [
+        {"role": "TSUKKOMI", "text": "こんにちは", "audio_file": "script_0.wav"},
+        {"role": "BOKE", "text": "どうも", "audio_file": "script_1.wav"},
+    ]
+    assert events[2] == "event: done\ndata: {}"
+    mock_voicevox.generate_voice_async.assert_any_call("どうも", 2)
+
+
+def test_generate_stream_endpoint_error_event(client, app_with_mocks):
+    """Test that a failure after streaming has started is reported as an error event."""
+    _, mock_ollama, _, _ = app_with_mocks
+
+    def failing_lines():
+        raise OllamaServiceError("stream broke")
+        yield
+
+    mock_ollama.stream_manzai_script.return_value = failing_lines()
+
+    response = client.post("/api/generate-stream", json={"topic": "テスト"})
+
+    body = response.get_data(as_text=True)
+    assert body.startswith("event: error\n")
+    assert "stream broke" in body
+
+
 def test_generate_endpoint_empty_topic(client):
     """Test script generation with empty topic."""
     response = client.post("/api/generate", json={"topic": "", "model": "gemma3:4b"})
@@ -160,7 +329,7 @@ def test_generate_endpoint_voicevox_error(client, app_with_mocks):
         ScriptLine(role=Role.BOKE, text="どうも"),
     ]
     mock_ollama.generate_manzai_script.return_value = mock_script
-    mock_voicevox.synthesize_voice.side_effect = VoiceVoxServiceError("Test error")
+    mock_voicevox.synthesize_many.side_effect = VoiceVoxServiceError("Test error")
 
     # Call endpoint
     response = client.post("/api/generate", json={"topic": "テスト", "model": "gemma3:4b"})
@@ -232,6 +401,18 @@ def test_list_audio_files(client, app_with_mocks):
     mock_audio_manager.list_audio_files.assert_called_once()
 
 
+def test_list_audio_files_not_modified(client, app_with_mocks):
+    """Test that an unchanged audio directory answers 304 without listing files."""
+    _, _, _, mock_audio_manager = app_with_mocks
+    mock_audio_manager.state_token.return_value = 1234567890
+
+    response = client.get("/api/audio/list", headers={"If-None-Match": '"1234567890"'})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"1234567890"'
+    mock_audio_manager.list_audio_files.assert_not_called()
+
+
 def test_cleanup_audio_files(client, app_with_mocks):
     """Test audio file cleanup endpoint."""
     _, _, _, mock_audio_manager = app_with_mocks
@@ -292,3 +473,96 @@ def test_get_speakers_error(client, app_with_mocks):
     data = json.loads(response.data)
     assert "error" in data
     assert "Test error" in data["error"]
+
+
+def test_api_error_handler_hides_unexpected_errors():
+    """Test that unexpected exceptions return a generic body without internal details."""
+    app = Flask(__name__)
+    register_error_handlers(app)
+
+    @app.route("/boom")
+    @api_error_handler
+    def boom():
+        raise RuntimeError("secret internal detail")
+
+    response = app.test_client().get("/boom")
+    assert response.status_code == 500
+    assert response.mimetype == "application/json"
+    assert json.loads(response.data) == {"error": "Unexpected error"}
+
+
+def test_api_error_handler_formats_validation_errors():
+    """Test that Pydantic validation errors are returned as a 400 with details."""
+    app = Flask(__name__)
+    register_error_handlers(app)
+
+    class Payload(BaseModel):
+        count: int
+
+    @app.route("/validate")
+    @api_error_handler
+    def validate():
+        Payload(count="many")
+
+    response = app.test_client().get("/validate")
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert data["error"] == "Validation error"
+    assert data["details"][0]["loc"] == ["count"]
+    assert data["details"][0]["type"] == "int_parsing"
+    assert "url" in data["details"][0]
+
+
+def test_validation_error_with_exception_context_is_serialized():
+    """Test that validator exceptions in the error context are returned as strings."""
+    app = Flask(__name__)
+    register_error_handlers(app)
+
+    class Payload(BaseModel):
+        name: str
+
+        @field_validator("name")
+        @classmethod
+        def reject(cls, v: str) -> str:
+            raise ValueError("bad name")
+
+    @app.route("/validate")
+    def validate():
+        Payload(name="x")
+
+    response = app.test_client().get("/validate")
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert data["details"][0]["ctx"] == {"error": "bad name"}
+
+
+def test_single_api_error_class_handles_app_exceptions():
+    """Test that error_handlers and exceptions share one APIError and its subclasses are handled."""
+    from src.backend.app.utils import error_handlers, exceptions
+
+    assert error_handlers.APIError is exceptions.APIError
+
+    app = Flask(__name__)
+    register_error_handlers(app)
+
+    @app.route("/upload")
+    @api_error_handler
+    def upload():
+        raise exceptions.ContentTypeError()
+
+    response = app.test_client().get("/upload")
+    assert response.status_code == 415
+    assert json.loads(response.data) == {"error": "Unsupported Media Type"}
+
+
+def test_unexpected_error_handler_keeps_http_errors():
+    """Test that the catch-all handler does not turn HTTP errors into 500s."""
+    app = Flask(__name__)
+    register_error_handlers(app)
+
+    @app.route("/only-get", methods=["GET"])
+    def only_get():
+        return "ok"
+
+    response = app.test_client().post("/only-get")
+    assert response.status_code == 405
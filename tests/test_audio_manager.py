@@ -58,6 +58,25 @@ def test_save_audio(audio_manager: AudioManager, temp_audio_dir: str) -> None:
     assert os.path.basename(result).startswith(datetime.now().strftime("%Y%m%d_"))
 
 
+def test_save_audio_unique_within_same_second(audio_manager: AudioManager) -> None:
+    """Test that saving the same filename twice does not overwrite the first file."""
+    first = audio_manager.save_audio(b"first", "same.wav")
+    second = audio_manager.save_audio(b"second", "same.wav")
+
+    assert first != second
+    assert audio_manager.get_audio(first) == b"first"
+    assert audio_manager.get_audio(second) == b"second"
+
+
+def test_save_audio_chunks(audio_manager: AudioManager) -> None:
+    """Test saving audio data given as a list of chunks."""
+    chunks = [b"RIFF", b"", b"test ", b"audio data"]
+
+    result = audio_manager.save_audio(chunks, "chunks.wav", durable=True)
+
+    assert audio_manager.get_audio(result) == b"RIFFtest audio data"
+
+
 def test_save_audio_invalid_data(audio_manager: AudioManager) -> None:
     """Test save_audio with invalid data."""
     with pytest.raises(ValueError, match="invalid audio data"):
@@ -139,6 +158,27 @@ def test_list_audio_files_empty_dir(audio_manager: AudioManager) -> None:
     assert len(result) == 0
 
 
+def test_list_audio_files_cache_invalidated_on_save(audio_manager: AudioManager) -> None:
+    """Test that the cached file list is refreshed after saving a file."""
+    assert audio_manager.list_audio_files() == []
+
+    saved = audio_manager.save_audio(b"test", "cached.wav")
+
+    assert audio_manager.list_audio_files() == [saved]
+
+
+def test_state_token_changes_when_files_change(audio_manager: AudioManager) -> None:
+    """Test that the state token reflects additions to the audio directory."""
+    before = audio_manager.state_token()
+    assert audio_manager.state_token() == before
+
+    # Bump the directory mtime explicitly so the test does not depend on timestamp resolution
+    audio_manager.save_audio(b"test", "token.wav")
+    os.utime(audio_manager.audio_dir, ns=(before + 1_000_000_000, before + 1_000_000_000))
+
+    assert audio_manager.state_token() != before
+
+
 def test_cleanup_old_files(audio_manager: AudioManager, temp_audio_dir: str) -> None:
     """Test cleaning up old audio files."""
     # Create test files
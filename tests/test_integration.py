@@ -64,6 +64,7 @@ def mock_services(mock_ollama_responses, mock_voicevox_responses):
     # Mock VoiceVoxService requests
     voicevox_patcher = patch("src.backend.app.services.voicevox_service.requests")
     mock_voicevox = voicevox_patcher.start()
+    mock_voicevox.Session.return_value = mock_voicevox
 
     # Configure the mock responses
     mock_post_response = MagicMock()
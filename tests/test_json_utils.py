@@ -0,0 +1,45 @@
+"""Test the JSON utility functions."""
+
+import json
+
+import pytest
+
+from src.backend.app.utils import json_utils
+
+
+def test_loads_accepts_str_and_bytes() -> None:
+    """Test decoding from both str and bytes input."""
+    assert json_utils.loads('{"key": "値"}') == {"key": "値"}
+    assert json_utils.loads('{"key": "値"}'.encode("utf-8")) == {"key": "値"}
+
+
+def test_loads_invalid_json() -> None:
+    """Test that invalid JSON raises json.JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads(b"{invalid")
+
+
+def test_dumps_round_trip() -> None:
+    """Test that dumps produces UTF-8 JSON bytes that decode to the same object."""
+    data = {"role": "boke", "text": "こんにちは", "values": [1, 2.5, None, True]}
+    encoded = json_utils.dumps(data)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == data
+
+
+def test_dumps_pretty() -> None:
+    """Test that pretty output is indented and keeps non-ASCII text readable."""
+    encoded = json_utils.dumps({"name": "漫才", "tags": ["a"]}, pretty=True)
+    assert b'\n  "name": "\xe6\xbc\xab\xe6\x89\x8d"' in encoded
+    assert json.loads(encoded) == {"name": "漫才", "tags": ["a"]}
+
+
+def test_stdlib_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the stdlib json module is used when no faster library is installed."""
+    monkeypatch.setattr(json_utils, "orjson", None)
+    monkeypatch.setattr(json_utils, "ujson", None)
+
+    assert json_utils.loads(memoryview('{"key": "値"}'.encode("utf-8"))) == {"key": "値"}
+    assert json_utils.dumps({"key": "値"}) == '{"key":"値"}'.encode("utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads("{invalid")
@@ -0,0 +1,69 @@
+"""Test the logging utility."""
+
+import io
+import logging
+from logging.handlers import QueueHandler
+
+from src.backend.app.utils import logger as logger_module
+from src.backend.app.utils.logger import setup_logger
+
+
+def _capture(logger: logging.Logger) -> io.StringIO:
+    """Redirect the logger's background stream handler into a buffer."""
+    stream = io.StringIO()
+    logger_module._listeners[-1].handlers[0].setStream(stream)
+    return stream
+
+
+def _flush() -> None:
+    """Wait until the background listener has written every queued record."""
+    logger_module._listeners[-1].queue.join()
+
+
+def test_setup_logger_adds_emoji():
+    """Test that log lines carry the emoji for their level."""
+    logger = setup_logger("test_logger_emoji")
+    stream = _capture(logger)
+
+    logger.warning("careful")
+    logger.info("hello")
+    _flush()
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0].startswith("⚠️ ")
+    assert lines[0].endswith("WARNING: careful")
+    assert lines[1].startswith("📝 ")
+
+
+def test_setup_logger_formats_records_without_emoji():
+    """Test that records created without the factory still format."""
+    logger = setup_logger("test_logger_plain_record")
+    stream = _capture(logger)
+
+    logger.handle(logging.LogRecord("plain", logging.ERROR, __file__, 1, "boom", None, None))
+    _flush()
+
+    assert stream.getvalue().startswith("📌 ")
+
+
+def test_setup_logger_writes_off_thread():
+    """Test that the logger only enqueues records and a listener does the writing."""
+    logger = setup_logger("test_logger_queue")
+    assert isinstance(logger.handlers[-1], QueueHandler)
+    assert logger_module._listeners[-1]._thread is not None
+
+
+def test_queue_handler_respects_handler_level():
+    """Test that records below a wrapped handler's level are not written."""
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setLevel(logging.WARNING)
+    logger = logging.getLogger("test_logger_level")
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(logger_module.queue_handler(target))
+
+    logger.info("ignored")
+    logger.error("written")
+    _flush()
+
+    assert stream.getvalue() == "written\n"
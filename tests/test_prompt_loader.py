@@ -107,7 +107,7 @@ def test_create_prompt(prompt_loader, temp_dirs):
     prompts_dir, _ = temp_dirs
 
     # Mock UUID generation for deterministic testing
-    test_uuid = "123e4567-e89b-12d3-a456-426614174000"
+    test_uuid = "123e4567e89b12d3a456426614174000"
 
     with patch("src.backend.app.utils.prompt_loader.uuid4", return_value=uuid.UUID(test_uuid)):
         # Test data
@@ -203,6 +203,37 @@ def test_load_template_txt_preferred_over_json(prompt_loader, temp_dirs):
     assert result == "This is a JSON template with test value"
 
 
+def test_load_template_cached_until_file_changes(prompt_loader, temp_dirs):
+    """Test that a template is read once and re-read after it is modified."""
+    _, templates_dir = temp_dirs
+    file_path = os.path.join(templates_dir, "cached_template.txt")
+    with open(file_path, "w") as f:
+        f.write("First {placeholder}")
+
+    assert prompt_loader.load_template("cached_template", placeholder="a") == "First a"
+    with patch("builtins.open", side_effect=AssertionError("template re-read")):
+        assert prompt_loader.load_template("cached_template", placeholder="b") == "First b"
+
+    with open(file_path, "w") as f:
+        f.write("Second version {placeholder}")
+    assert prompt_loader.load_template("cached_template", placeholder="c") == "Second version c"
+
+
+def test_load_template_matches_str_format(prompt_loader, temp_dirs):
+    """Test that pre-parsed rendering and the format-spec fallback match str.format."""
+    _, templates_dir = temp_dirs
+    templates = {
+        "plain_fields": "{topic} と {{literal}} の {count} 本",
+        "with_spec": "{topic!r} は {count:03d} 本",
+    }
+    for name, content in templates.items():
+        with open(os.path.join(templates_dir, f"{name}.txt"), "w") as f:
+            f.write(content)
+
+        result = prompt_loader.load_template(name, topic="漫才", count=7)
+        assert result == content.format(topic="漫才", count=7)
+
+
 def test_load_template_not_found(prompt_loader):
     """Test loading a non-existent template."""
     with pytest.raises(PromptTemplateNotFoundError):
@@ -2,6 +2,8 @@
 
 import json
 import os
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -16,6 +18,7 @@ from src.backend.app.services.ollama_service import (
     OllamaServiceError,
 )
 from src.backend.app.services.voicevox_service import (
+    VoiceVoxCircuitOpenError,
     VoiceVoxService,
     VoiceVoxServiceError,
 )
@@ -57,6 +60,57 @@ def test_ollama_client_init():
     assert client.instance_type == "local"
 
 
+def test_ollama_client_file_handler_added_once(monkeypatch, tmp_path):
+    """Test that creating several clients attaches a single log file handler."""
+    from src.backend.app.services import ollama_service as module
+
+    monkeypatch.setenv("OLLAMA_LOG_DIR", str(tmp_path))
+    try:
+        OllamaClient(base_url="http://test:11434")
+        OllamaClient(base_url="http://test:11434")
+        module._ensure_file_handler()
+
+        names = [handler.name for handler in module.logger.handlers]
+        assert names.count(module._FILE_HANDLER_NAME) == 1
+    finally:
+        for handler in list(module.logger.handlers):
+            if handler.name == module._FILE_HANDLER_NAME:
+                module.logger.removeHandler(handler)
+
+
+def test_ollama_client_file_handler_disabled(monkeypatch):
+    """Test that an empty OLLAMA_LOG_DIR disables the log file."""
+    from src.backend.app.services import ollama_service as module
+
+    monkeypatch.setenv("OLLAMA_LOG_DIR", "")
+    OllamaClient(base_url="http://test:11434")
+
+    assert all(handler.name != module._FILE_HANDLER_NAME for handler in module.logger.handlers)
+
+
+def test_ollama_client_session_retries_and_close():
+    """Test that the pooled session retries gateway errors and is closed by close()."""
+    client = OllamaClient(base_url="http://test:11434")
+    retry = client._session.get_adapter("http://test:11434").max_retries
+    assert retry.total == 2
+    assert retry.connect == 0
+    assert 503 in retry.status_forcelist
+    assert "POST" not in retry.allowed_methods
+
+    with patch.object(client._session, "close") as mock_close:
+        client.close()
+    mock_close.assert_called_once()
+
+
+def test_ollama_client_workers_follow_num_parallel(monkeypatch):
+    """Test that the client's concurrency follows OLLAMA_NUM_PARALLEL."""
+    monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "2")
+    assert OllamaClient(base_url="http://test:11434")._executor._max_workers == 2
+
+    monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "invalid")
+    assert OllamaClient(base_url="http://test:11434")._executor._max_workers == 4
+
+
 def test_prepare_request_data(ollama_client):
     """Test request data preparation."""
     data = ollama_client._prepare_request_data("test prompt", "test-model")
@@ -66,7 +120,7 @@ def test_prepare_request_data(ollama_client):
 
 
 @patch.object(OllamaClient, "check_ollama_availability")
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_generate_text_sync_success(mock_post, mock_check, ollama_client, mock_response):
     """Test successful text generation."""
     mock_check.return_value = {
@@ -74,16 +128,94 @@ def test_generate_text_sync_success(mock_post, mock_check, ollama_client, mock_r
         "models": ["test-model"],
         "error": None,
     }
-    mock_response.json.return_value = {"response": "generated text"}
+    mock_response.iter_lines.return_value = [
+        b'{"response": "generated ", "done": false}',
+        b"",
+        b'{"response": "text", "done": true}',
+    ]
     mock_post.return_value = mock_response
 
     result = ollama_client.generate_text_sync("test prompt", "test-model")
     assert result == "generated text"
     mock_post.assert_called_once()
+    assert json.loads(mock_post.call_args.kwargs["data"])["stream"] is True
+    assert mock_post.call_args.kwargs["stream"] is True
+
+
+@patch.object(OllamaClient, "check_ollama_availability")
+@patch("requests.Session.post")
+def test_generate_text_sync_skip_availability_check(
+    mock_post, mock_check, ollama_client, mock_response
+):
+    """Test that a caller-verified generation does not probe availability again."""
+    mock_response.iter_lines.return_value = [b'{"response": "generated text", "done": true}']
+    mock_post.return_value = mock_response
+
+    result = ollama_client.generate_text_sync(
+        "test prompt", "test-model", skip_availability_check=True
+    )
+    assert result == "generated text"
+    mock_check.assert_not_called()
+
+
+@patch("requests.Session.post")
+def test_generate_text_async(mock_post, ollama_client, mock_response):
+    """Test that several prompts can be submitted and resolved concurrently."""
+    mock_response.iter_lines.return_value = [b'{"response": "generated text", "done": true}']
+    mock_post.return_value = mock_response
+
+    futures = [
+        ollama_client.generate_text_async(f"prompt {i}", "test-model", skip_availability_check=True)
+        for i in range(3)
+    ]
+    assert [f.result(timeout=5) for f in futures] == ["generated text"] * 3
+    assert mock_post.call_count == 3
+
+
+@patch.object(OllamaClient, "generate_text_sync")
+def test_generate_many(mock_generate, ollama_client):
+    """Test that prompts are generated concurrently and returned in prompt order."""
+    # Each request waits for the other, so a serial implementation would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def generate(prompt, model_name, options, skip_availability_check):
+        barrier.wait()
+        return f"{prompt} done"
+
+    mock_generate.side_effect = generate
+
+    result = ollama_client.generate_many(["a", "b"], "test-model", skip_availability_check=True)
+    assert result == ["a done", "b done"]
+
+
+@patch.object(OllamaClient, "check_ollama_availability")
+@patch("requests.Session.post")
+def test_generate_text_sync_stream_error(mock_post, mock_check, ollama_client, mock_response):
+    """Test that an error chunk in the stream is reported as-is."""
+    mock_response.iter_lines.return_value = [b'{"error": "model crashed"}']
+    mock_post.return_value = mock_response
+
+    with pytest.raises(OllamaServiceError, match=r"^Ollama API error: model crashed$"):
+        ollama_client.generate_text_sync("test prompt", "test-model", skip_availability_check=True)
+    mock_response.close.assert_called_once()
+
+
+@patch("requests.Session.post")
+def test_generate_text_sync_connection_error(mock_post, ollama_client):
+    """Test that connection errors are reported and use a short connect timeout."""
+    mock_post.side_effect = requests.exceptions.ConnectionError("refused")
+
+    with patch.object(ollama_client, "invalidate_availability_cache") as mock_invalidate:
+        with pytest.raises(OllamaServiceError, match=r"^Connection error with Ollama API"):
+            ollama_client.generate_text_sync("prompt", "test-model", skip_availability_check=True)
+
+    mock_invalidate.assert_called_once()
+    connect_timeout, read_timeout = mock_post.call_args.kwargs["timeout"]
+    assert connect_timeout < read_timeout
 
 
 @patch.object(OllamaClient, "check_ollama_availability")
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_generate_text_sync_error(mock_post, mock_check, ollama_client):
     """Test text generation error handling."""
     mock_check.return_value = {
@@ -97,10 +229,10 @@ def test_generate_text_sync_error(mock_post, mock_check, ollama_client):
         ollama_client.generate_text_sync("test prompt", "test-model")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_list_models_success(mock_get, ollama_client, mock_response):
     """Test successful model listing."""
-    mock_response.json.return_value = {"models": [{"name": "test-model"}]}
+    mock_response.content = b'{"models": [{"name": "test-model"}]}'
     mock_get.return_value = mock_response
 
     result = ollama_client.list_models()
@@ -108,6 +240,137 @@ def test_list_models_success(mock_get, ollama_client, mock_response):
     assert result[0]["name"] == "test-model"
 
 
+@patch("requests.Session.get")
+def test_list_models_ignores_non_object_response(mock_get, ollama_client, mock_response):
+    """Test that a non-object body from /api/models falls through to /api/tags."""
+    models_response = Mock(content=b'["unexpected"]')
+    mock_response.content = b'{"models": [{"name": "tags-model"}]}'
+    mock_get.side_effect = lambda url, timeout: (
+        models_response if url.endswith("/api/models") else mock_response
+    )
+
+    assert ollama_client.list_models() == [{"name": "tags-model"}]
+
+
+@patch("requests.Session.get")
+def test_check_ollama_availability_cached(mock_get, ollama_client, mock_response):
+    """Test that a successful availability check is reused within the TTL."""
+    mock_response.content = b'{"models": [{"name": "test-model"}]}'
+    mock_get.return_value = mock_response
+
+    first = ollama_client.check_ollama_availability()
+    second = ollama_client.check_ollama_availability()
+    assert first["available"] is True
+    assert second["models"] == ["test-model"]
+    mock_get.assert_called_once()
+
+    ollama_client.invalidate_availability_cache()
+    ollama_client.check_ollama_availability()
+    assert mock_get.call_count == 2
+
+
+def test_check_ollama_availability_background_watch():
+    """Test that a background health check serves results without probing per request."""
+    status = {"available": False, "models": [], "error": "down", "instance_type": "local"}
+
+    with patch.object(OllamaClient, "_probe_availability", return_value=status) as mock_probe:
+        client = OllamaClient(base_url="http://test:11434", health_interval=60)
+        try:
+            deadline = time.monotonic() + 5
+            while client._availability_cache is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert client.check_ollama_availability()["error"] == "down"
+            assert mock_probe.call_count == 1
+        finally:
+            client.close()
+
+
+def test_get_detailed_status_not_blocked_by_generation(monkeypatch):
+    """Test that the version probe does not queue behind running generations."""
+    monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "1")
+    client = OllamaClient(base_url="http://test:11434")
+    release = threading.Event()
+    available = {"available": True, "models": ["m"], "error": None, "instance_type": "local"}
+    try:
+        with (
+            patch.object(client, "generate_text_sync", side_effect=lambda *a, **k: release.wait()),
+            patch.object(client, "check_ollama_availability", return_value=available),
+            patch.object(client, "_fetch_api_version", return_value=("0.1.0", 3)),
+        ):
+            client.generate_text_async("busy")
+            status = client.get_detailed_status()
+        assert status["api_version"] == "0.1.0"
+    finally:
+        release.set()
+        client.close()
+
+
+@patch("requests.Session.get")
+def test_check_ollama_availability_prefers_last_working_endpoint(
+    mock_get, ollama_client, mock_response
+):
+    """Test that the endpoint that answered last time is probed first."""
+    mock_response.content = b'{"models": [{"name": "test-model"}]}'
+
+    def fake_get(url, timeout):
+        if url.endswith("/api/tags"):
+            raise requests.exceptions.ConnectionError("not found")
+        return mock_response
+
+    mock_get.side_effect = fake_get
+
+    assert ollama_client.check_ollama_availability()["available"] is True
+    assert [c.args[0] for c in mock_get.call_args_list] == [
+        "http://test:11434/api/tags",
+        "http://test:11434/api/models",
+    ]
+
+    mock_get.reset_mock()
+    ollama_client.invalidate_availability_cache()
+    assert ollama_client.check_ollama_availability()["available"] is True
+    mock_get.assert_called_once()
+    assert mock_get.call_args.args[0] == "http://test:11434/api/models"
+
+
+@patch("requests.Session.get")
+def test_client_get_detailed_status(mock_get, ollama_client):
+    """Test detailed status combines the availability probe and the version probe."""
+
+    def fake_get(url, timeout):
+        response = Mock()
+        response.status_code = 200
+        if url.endswith("/api/version"):
+            response.content = b'{"version": "0.6.0"}'
+        else:
+            response.content = b'{"models": [{"name": "test-model"}]}'
+        return response
+
+    mock_get.side_effect = fake_get
+
+    status = ollama_client.get_detailed_status()
+    assert status["available"] is True
+    assert status["models"] == ["test-model"]
+    assert status["api_version"] == "0.6.0"
+    assert isinstance(status["response_time_ms"], int)
+
+
+@patch("requests.Session.get")
+def test_list_models_falls_back_to_tags(mock_get, ollama_client, mock_response):
+    """Test that /api/tags is used when /api/models is not available."""
+    mock_response.content = b'{"models": [{"name": "tags-model"}]}'
+
+    def fake_get(url, timeout):
+        if url.endswith("/api/models"):
+            raise requests.exceptions.HTTPError("404 Not Found")
+        return mock_response
+
+    mock_get.side_effect = fake_get
+
+    result = ollama_client.list_models()
+    assert result == [{"name": "tags-model"}]
+    assert mock_get.call_args.args[0] == "http://test:11434/api/tags"
+
+
 def test_extract_json_block_success(ollama_client):
     """Test JSON block extraction."""
     text = '```json\n{"key": "value"}\n```'
@@ -115,6 +378,13 @@ def test_extract_json_block_success(ollama_client):
     assert json.loads(result) == {"key": "value"}
 
 
+def test_extract_json_block_surrounding_text(ollama_client):
+    """Test that a bare object surrounded by prose is extracted without the prose."""
+    text = 'Here you go: {"script": [{"speaker": "A", "text": "{x}"}]} Enjoy!'
+    result = ollama_client._extract_json_block(text)
+    assert json.loads(result) == {"script": [{"speaker": "A", "text": "{x}"}]}
+
+
 def test_extract_json_block_error(ollama_client):
     """Test JSON block extraction error."""
     with pytest.raises(OllamaServiceError):
@@ -164,6 +434,118 @@ def test_generate_manzai_script_error(mock_generate, ollama_service):
         ollama_service.generate_manzai_script("テスト")
 
 
+@patch.object(OllamaClient, "generate_json_sync")
+def test_generate_manzai_script_cached(mock_generate, ollama_service):
+    """Test that a repeated topic is served from the script cache unless bypassed."""
+    ollama_service.prompt_loader.load_template.return_value = "test prompt"
+    mock_generate.return_value = {"script": [{"speaker": "A", "text": "こんにちは"}]}
+
+    first = ollama_service.generate_manzai_script("テスト")
+    first[0].text = "changed"
+    second = ollama_service.generate_manzai_script("テスト")
+
+    assert second[0].text == "こんにちは"
+    mock_generate.assert_called_once()
+
+    ollama_service.generate_manzai_script("テスト", use_cache=False)
+    assert mock_generate.call_count == 2
+
+    ollama_service.invalidate_script_cache()
+    ollama_service.generate_manzai_script("テスト")
+    assert mock_generate.call_count == 3
+
+
+@patch.object(OllamaService, "perform_health_check")
+@patch.object(OllamaClient, "generate_json_sync")
+def test_generate_manzai_script_semantic_cache(mock_generate, mock_health):
+    """Test that a topic written slightly differently reuses the cached script."""
+    mock_health.return_value = {
+        "status": "healthy",
+        "available_models": ["gemma3:4b", "test-model"],
+    }
+    mock_generate.return_value = {"script": [{"speaker": "A", "text": "こんにちは"}]}
+    service = OllamaService(
+        base_url="http://test:11434", instance_type="local", semantic_cache_threshold=0.9
+    )
+    service.prompt_loader = Mock(spec=PromptLoader)
+    service.prompt_loader.load_template.side_effect = lambda name, topic: topic
+
+    service.generate_manzai_script("スマートフォン")
+    result = service.generate_manzai_script("スマート フォン")
+    assert result[0].text == "こんにちは"
+    mock_generate.assert_called_once()
+
+    service.generate_manzai_script("スマートフォン", model_name="test-model")
+    service.generate_manzai_script("天気")
+    assert mock_generate.call_count == 3
+
+
+@patch.object(OllamaService, "perform_health_check")
+@patch.object(OllamaClient, "generate_json_sync")
+def test_semantic_cache_respects_template_changes(mock_generate, mock_health):
+    """Test that an edited prompt template is not answered from the similar-topic tier."""
+    mock_health.return_value = {"status": "healthy", "available_models": ["gemma3:4b"]}
+    mock_generate.return_value = {"script": [{"speaker": "A", "text": "こんにちは"}]}
+    service = OllamaService(
+        base_url="http://test:11434", instance_type="local", semantic_cache_threshold=0.9
+    )
+    service.prompt_loader = Mock(spec=PromptLoader)
+    template = {"text": "v1: {topic}"}
+    service.prompt_loader.load_template.side_effect = lambda name, topic: template["text"].format(
+        topic=topic
+    )
+
+    service.generate_manzai_script("スマートフォン")
+    service.generate_manzai_script("スマートフォン", use_cache=False)
+    assert len(service._semantic_cache) == 1
+
+    template["text"] = "v2: {topic}"
+    service.generate_manzai_script("スマートフォン")
+    assert mock_generate.call_count == 3
+
+
+@patch.object(OllamaClient, "generate_json_sync")
+def test_generate_manzai_scripts_batch(mock_generate, ollama_service):
+    """Test that several topics are generated concurrently and returned in topic order."""
+    ollama_service.prompt_loader.load_template.side_effect = lambda name, topic: topic
+    # Each request waits for the other, so a serial implementation would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def generate(prompt, model_name, options, skip_availability_check):
+        barrier.wait()
+        return {"script": [{"speaker": "A", "text": f"{prompt}の話"}]}
+
+    mock_generate.side_effect = generate
+
+    result = ollama_service.generate_manzai_scripts_batch(["猫", "犬"])
+
+    assert [script[0].text for script in result] == ["猫の話", "犬の話"]
+    ollama_service.perform_health_check.assert_called_once()
+    with pytest.raises(ValueError, match="Topic cannot be empty"):
+        ollama_service.generate_manzai_scripts_batch(["猫", ""])
+
+
+def test_stream_manzai_script_yields_lines_as_generated(ollama_service):
+    """Test that each script line is yielded as soon as its newline has been generated."""
+    ollama_service.prompt_loader.load_template.return_value = "test prompt"
+    received = []
+
+    def pieces(*args, **kwargs):
+        for piece in ["A: こん", "にちは\nB: ど", "うも\n", "A: 終わり"]:
+            received.append(piece)
+            yield piece
+
+    with patch.object(OllamaClient, "generate_text_stream", side_effect=pieces):
+        lines = ollama_service.stream_manzai_script("テスト")
+        first = next(lines)
+        assert (first.role, first.text) == (Role.TSUKKOMI, "こんにちは")
+        assert received == ["A: こん", "にちは\nB: ど"]
+        assert [(line.role, line.text) for line in lines] == [
+            (Role.BOKE, "どうも"),
+            (Role.TSUKKOMI, "終わり"),
+        ]
+
+
 @pytest.fixture
 def mock_ollama_client():
     """Mock OllamaClient for testing."""
@@ -313,6 +695,16 @@ def test_parse_manzai_script_string(ollama_service):
     assert result[1].text == "そうですね、空が青いです。"
 
 
+def test_parse_manzai_script_fullwidth_colon(ollama_service):
+    """Test parsing script lines that use a fullwidth colon."""
+    script_text = "A：こんにちは\nB： 時刻は12:30です\nナレーション\nA:\n"
+    result = ollama_service._parse_manzai_script(script_text)
+    assert [(line.role, line.text) for line in result] == [
+        (Role.TSUKKOMI, "こんにちは"),
+        (Role.BOKE, "時刻は12:30です"),
+    ]
+
+
 def test_parse_manzai_script_dict(ollama_service):
     """Test parsing manzai script from dictionary format."""
     script_dict = {
@@ -329,6 +721,20 @@ def test_parse_manzai_script_dict(ollama_service):
     assert result[1].text == "どうも"
 
 
+def test_parse_manzai_script_dict_skips_incomplete_items(ollama_service):
+    """Test that non-dict items and items with missing or blank fields are skipped."""
+    script_dict = {
+        "script": [
+            "not a dict",
+            {"speaker": "A"},
+            {"speaker": " ", "text": "無視"},
+            {"speaker": " B ", "text": " どうも "},
+        ]
+    }
+    result = ollama_service._parse_manzai_script(script_dict)
+    assert [(line.role, line.text) for line in result] == [(Role.BOKE, "どうも")]
+
+
 def test_parse_manzai_script_code_block(ollama_service):
     """Test parsing manzai script from text with code blocks."""
     script_text = """
@@ -363,6 +769,8 @@ def mock_requests():
         }
         mock_req.post.return_value = mock_response
         mock_req.get.return_value = mock_response
+        # The service talks through its pooled session; route it back to this mock
+        mock_req.Session.return_value = mock_req
         yield mock_req
 
 
@@ -383,6 +791,19 @@ def test_voicevox_init():
     assert os.path.exists(service.output_dir)
 
 
+def test_voicevox_injected_session():
+    """Test that an injected session is used for requests and closed by close()."""
+    session = Mock(spec=requests.Session)
+    session.get.return_value.status_code = 200
+    session.get.return_value.json.return_value = []
+    service = VoiceVoxService(base_url="http://custom:50021", session=session)
+
+    assert service.get_speakers() == []
+    session.get.assert_called_once()
+    service.close()
+    session.close.assert_called_once()
+
+
 def test_generate_voice_success(voicevox_service, mock_requests):
     """Test successful voice generation."""
     result = voicevox_service.generate_voice("こんにちは", 1)
@@ -397,6 +818,33 @@ def test_generate_voice_success(voicevox_service, mock_requests):
     assert kwargs["params"] == {"speaker": 1}
 
 
+def test_timeout_applied_to_all_requests(voicevox_service, mock_requests):
+    """Test that the configured timeout is passed to every VoiceVox request."""
+    voicevox_service.timeout = (1.0, 2.0)
+    voicevox_service.generate_voice("test", 1)
+    voicevox_service.get_speakers()
+    voicevox_service.check_availability()
+
+    calls = mock_requests.post.call_args_list + mock_requests.get.call_args_list
+    assert len(calls) == 4
+    assert all(call.kwargs["timeout"] == (1.0, 2.0) for call in calls)
+
+
+def test_synthesize_many(voicevox_service, mock_requests):
+    """Test that several lines are synthesized concurrently and returned in order."""
+
+    def fake_post(url, params, timeout, json=None, stream=False):
+        response = Mock(status_code=200)
+        response.json.return_value = {"text": params.get("text")}
+        response.content = f"audio:{json['text']}".encode() if json else b""
+        return response
+
+    mock_requests.post.side_effect = fake_post
+    result = voicevox_service.synthesize_many([("a", 1), ("b", 2), ("c", 3)])
+    assert result == [b"audio:a", b"audio:b", b"audio:c"]
+    assert mock_requests.post.call_count == 6
+
+
 def test_generate_voice_empty_text(voicevox_service):
     """Test voice generation with empty text."""
     with pytest.raises(ValueError, match="text cannot be empty"):
@@ -444,6 +892,24 @@ def test_get_timing_data_success(voicevox_service, mock_requests):
     assert kwargs["params"] == {"text": "こんにちは", "speaker": 1}
 
 
+def test_audio_query_cached(voicevox_service, mock_requests):
+    """Test that repeated phrases reuse the audio query and get independent copies."""
+    first = voicevox_service.get_timing_data("はい", 1)
+    first["accent_phrases"].clear()
+    second = voicevox_service.get_timing_data("はい", 1)
+    assert len(second["accent_phrases"]) == 1
+    mock_requests.post.assert_called_once()
+
+    voicevox_service.get_timing_data("はい", 2)
+    assert mock_requests.post.call_count == 2
+
+    # A different engine version drops the cached queries
+    mock_requests.get.return_value.text = "0.15.0"
+    voicevox_service.check_availability()
+    voicevox_service.get_timing_data("はい", 1)
+    assert mock_requests.post.call_count == 3
+
+
 def test_get_timing_data_error(voicevox_service, mock_requests):
     """Test timing data retrieval when API returns an error."""
     error_response = Mock()
@@ -472,25 +938,37 @@ def test_synthesize_voice_success(voicevox_service, mock_requests, tmp_path):
     # Mock synthesis response
     synthesis_response = Mock()
     synthesis_response.status_code = 200
-    synthesis_response.content = b"test audio data"
+    synthesis_response.iter_content.return_value = [b"test audio ", b"data"]
+
+    # A single audio_query feeds both the synthesis and the timing data
+    mock_requests.post.side_effect = [audio_query_response, synthesis_response]
+
+    result = voicevox_service.synthesize_voice("こんにちは", 1)
+    assert isinstance(result, AudioSynthesisResult)
+    assert result.speaker_id == 1
+    assert result.text == "こんにちは"
+    assert len(result.timing_data) == 2
+    assert isinstance(result.timing_data[0], SpeechTimingData)
+    assert result.timing_data[0].text == "こ"
+    assert result.timing_data[1].text == "ん"
+    with open(result.file_path, "rb") as f:
+        assert f.read() == b"test audio data"
+    assert mock_requests.post.call_count == 2
+    assert mock_requests.post.call_args_list[1].kwargs["json"] == audio_query_response.json()
+    assert mock_requests.post.call_args_list[1].kwargs["stream"] is True
+    synthesis_response.close.assert_called_once()
 
-    # Set up mock responses in order: get_timing_data + generate_voice (2 calls each)
-    mock_requests.post.side_effect = [
-        audio_query_response,  # get_timing_data call
-        audio_query_response,  # generate_voice first call
-        synthesis_response,  # generate_voice second call
-    ]
 
-    with patch("builtins.open", create=True) as mock_open:
-        result = voicevox_service.synthesize_voice("こんにちは", 1)
-        assert isinstance(result, AudioSynthesisResult)
-        assert result.speaker_id == 1
-        assert result.text == "こんにちは"
-        assert len(result.timing_data) == 2
-        assert isinstance(result.timing_data[0], SpeechTimingData)
-        assert result.timing_data[0].text == "こ"
-        assert result.timing_data[1].text == "ん"
-        mock_open.assert_called()
+def test_synthesize_voice_stream_error_removes_partial_file(voicevox_service, mock_requests):
+    """Test that a broken synthesis stream leaves no partial file behind."""
+    synthesis_response = Mock()
+    synthesis_response.status_code = 200
+    synthesis_response.iter_content.side_effect = requests.exceptions.ChunkedEncodingError("cut")
+    mock_requests.post.side_effect = [mock_requests.post.return_value, synthesis_response]
+
+    with pytest.raises(VoiceVoxServiceError):
+        voicevox_service.synthesize_voice("こんにちは", 1)
+    assert os.listdir(voicevox_service.output_dir) == []
 
 
 def test_get_speakers_success(voicevox_service, mock_requests):
@@ -547,6 +1025,22 @@ def test_list_speakers_success(voicevox_service, mock_requests):
     assert result[2].style_name == "あまあま"
 
 
+def test_list_speakers_cached(voicevox_service, mock_requests):
+    """Test that the speaker list is fetched once within the TTL."""
+    mock_requests.get.return_value.json.return_value = [
+        {"name": "Speaker1", "speaker_uuid": "uuid1", "styles": [{"id": 1, "name": "Normal"}]}
+    ]
+    first = voicevox_service.list_speakers()
+    second = voicevox_service.list_speakers()
+    assert first == second
+    assert first is not second
+    mock_requests.get.assert_called_once()
+
+    voicevox_service.invalidate_speakers_cache()
+    voicevox_service.list_speakers()
+    assert mock_requests.get.call_count == 2
+
+
 def test_list_speakers_error(voicevox_service, mock_requests):
     """Test speaker list retrieval when API returns an error."""
     mock_requests.get.side_effect = Exception("Connection error")
@@ -566,7 +1060,7 @@ def test_check_availability_success(voicevox_service, mock_requests):
         ]
         with patch("time.time") as mock_time:
             mock_time.side_effect = [0.0, 0.1]  # start and end times
-            result = voicevox_service.check_availability()
+            result = voicevox_service.check_availability(include_speakers=True)
             assert result["available"] is True
             assert result["speakers"] == 2
             assert result["version"] == "0.14.0"
@@ -574,6 +1068,17 @@ def test_check_availability_success(voicevox_service, mock_requests):
             assert result["response_time_ms"] == 100
 
 
+def test_check_availability_skips_speakers_by_default(voicevox_service, mock_requests):
+    """Test that a plain availability check only probes the version endpoint."""
+    mock_requests.get.return_value.text = "0.14.0"
+    with patch.object(voicevox_service, "list_speakers") as mock_list_speakers:
+        result = voicevox_service.check_availability()
+    assert result["available"] is True
+    assert result["version"] == "0.14.0"
+    assert result["speakers"] == 0
+    mock_list_speakers.assert_not_called()
+
+
 def test_check_availability_error(voicevox_service, mock_requests):
     """Test availability check when API is unavailable."""
     mock_requests.get.side_effect = requests.exceptions.ConnectionError("Connection error")
@@ -618,6 +1123,7 @@ def test_get_fallback_audio(voicevox_service):
     assert isinstance(result, bytes)
     assert len(result) > 0
     assert len(result) > 44  # Should be a valid WAV structure
+    assert result == bytes(2 * 44100)  # 16-bit signed PCM silence is all zeros
 
 
 # Additional tests for better coverage
@@ -638,7 +1144,7 @@ def test_synthesize_voice_complex_timing(voicevox_service, mock_requests, tmp_pa
             {
                 "moras": [
                     {"text": "ち", "consonant_length": 0.08, "vowel_length": 0.12},
-                    {"text": "は", "consonant_length": 0.0, "vowel_length": 0.18},
+                    {"text": "は", "consonant_length": None, "vowel_length": 0.18},
                 ]
             },
         ]
@@ -647,14 +1153,10 @@ def test_synthesize_voice_complex_timing(voicevox_service, mock_requests, tmp_pa
     # Mock synthesis response
     synthesis_response = Mock()
     synthesis_response.status_code = 200
-    synthesis_response.content = b"complex audio data"
+    synthesis_response.iter_content.return_value = [b"complex audio data"]
 
-    # Set up mock responses in order: get_timing_data + generate_voice (2 calls each)
-    mock_requests.post.side_effect = [
-        audio_query_response,  # get_timing_data call
-        audio_query_response,  # generate_voice first call
-        synthesis_response,  # generate_voice second call
-    ]
+    # A single audio_query feeds both the synthesis and the timing data
+    mock_requests.post.side_effect = [audio_query_response, synthesis_response]
 
     with patch("builtins.open", create=True) as mock_open:
         result = voicevox_service.synthesize_voice("こんにちは", 2)
@@ -662,6 +1164,7 @@ def test_synthesize_voice_complex_timing(voicevox_service, mock_requests, tmp_pa
         assert result.speaker_id == 2
         assert result.text == "こんにちは"
         assert len(result.timing_data) == 5  # Total moras
+        assert result.duration == pytest.approx(0.98)
         assert all(isinstance(td, SpeechTimingData) for td in result.timing_data)
         mock_open.assert_called()
 
@@ -674,6 +1177,72 @@ def test_generate_voice_error_handling(voicevox_service, mock_requests):
         voicevox_service.generate_voice("テスト", 1)
 
 
+def test_circuit_breaker_opens_after_consecutive_failures(voicevox_service, mock_requests):
+    """Test that repeated connection failures trip the breaker and fail fast."""
+    mock_requests.post.side_effect = requests.exceptions.ConnectionError("refused")
+    for _ in range(5):
+        with pytest.raises(VoiceVoxServiceError, match="Connection error"):
+            voicevox_service.get_timing_data("test", 1)
+    assert mock_requests.post.call_count == 5
+
+    with pytest.raises(VoiceVoxCircuitOpenError):
+        voicevox_service.get_timing_data("test", 1)
+    assert voicevox_service.generate_voice("test", 1) == voicevox_service.get_fallback_audio("test")
+    assert mock_requests.post.call_count == 5
+
+
+def test_circuit_breaker_half_open_recovers(voicevox_service, mock_requests):
+    """Test that a successful probe after the sleep window closes the breaker."""
+    mock_requests.post.side_effect = requests.exceptions.Timeout("slow")
+    for _ in range(5):
+        with pytest.raises(VoiceVoxServiceError):
+            voicevox_service.get_timing_data("test", 1)
+
+    mock_requests.post.side_effect = None
+    with patch(
+        "src.backend.app.services.voicevox_service.time.monotonic",
+        return_value=time.monotonic() + 60,
+    ):
+        assert "accent_phrases" in voicevox_service.get_timing_data("test", 1)
+    assert voicevox_service._breaker.state == "closed"
+
+
+def test_circuit_breaker_half_open_failure_reopens(voicevox_service, mock_requests):
+    """Test that any exception during the half-open probe reopens the breaker."""
+    mock_requests.post.side_effect = requests.exceptions.ConnectionError("refused")
+    for _ in range(5):
+        with pytest.raises(VoiceVoxServiceError):
+            voicevox_service.get_timing_data("test", 1)
+
+    later = time.monotonic() + 60
+    mock_requests.post.side_effect = requests.exceptions.ChunkedEncodingError("broken")
+    with patch("src.backend.app.services.voicevox_service.time.monotonic", return_value=later):
+        with pytest.raises(VoiceVoxServiceError):
+            voicevox_service.get_timing_data("test", 1)
+    assert voicevox_service._breaker.state == "open"
+
+    # Once the next sleep window has passed, a successful probe closes the breaker again
+    mock_requests.post.side_effect = None
+    with patch("src.backend.app.services.voicevox_service.time.monotonic", return_value=later + 60):
+        assert "accent_phrases" in voicevox_service.get_timing_data("test", 1)
+    assert voicevox_service._breaker.state == "closed"
+
+
+def test_error_classification_uses_exception_types(voicevox_service, mock_requests):
+    """Test that errors are classified by type rather than by class name."""
+
+    class FakeTimeoutError(Exception):
+        pass
+
+    mock_requests.post.side_effect = FakeTimeoutError("not a requests timeout")
+    with pytest.raises(VoiceVoxServiceError, match="Unexpected error in VoiceVox service"):
+        voicevox_service.get_timing_data("test", 1)
+
+    mock_requests.post.side_effect = requests.exceptions.ConnectTimeout("connect timeout")
+    with pytest.raises(VoiceVoxServiceError, match="Timeout error occurred"):
+        voicevox_service.get_timing_data("test", 1)
+
+
 def test_get_timing_data_error_handling(voicevox_service, mock_requests):
     """Test error handling in get_timing_data method."""
     # Test timeout error
@@ -728,7 +1297,7 @@ def test_check_availability_comprehensive(voicevox_service, mock_requests):
             VoiceVoxSpeaker(id=3, name="Speaker3", style_id=3, style_name="Style3"),
         ]
 
-        result = voicevox_service.check_availability()
+        result = voicevox_service.check_availability(include_speakers=True)
 
         assert result["available"] is True
         assert result["speakers"] == 3
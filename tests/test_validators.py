@@ -0,0 +1,85 @@
+"""Tests for the input validation utilities."""
+
+import io
+
+from werkzeug.datastructures import FileStorage
+
+from src.backend.app.utils.validators import (
+    sanitize_filename,
+    validate_model_data,
+    validate_model_file,
+    validate_prompt_data,
+    validate_script_params,
+)
+
+
+def test_validate_model_data():
+    """Test model data validation."""
+    assert validate_model_data({"name": "model", "type": "boke"}) == (True, "")
+
+    is_valid, error = validate_model_data({"name": " ", "type": "boke"})
+    assert is_valid is False
+    assert "モデル名は空にできません" in error
+
+
+def test_validate_prompt_data():
+    """Test prompt data validation."""
+    data = {"name": "manzai_basic-1", "content": "テンプレート", "tags": ["a", "b"]}
+    assert validate_prompt_data(data) == (True, "")
+
+    is_valid, error = validate_prompt_data({**data, "name": "bad name"})
+    assert is_valid is False
+    assert "英数字" in error
+
+    is_valid, error = validate_prompt_data({**data, "name": "  "})
+    assert is_valid is False
+    assert "プロンプト名は空にできません" in error
+
+    is_valid, _ = validate_prompt_data({**data, "name": "trailing_newline\n"})
+    assert is_valid is False
+
+    is_valid, _ = validate_prompt_data({**data, "tags": ["a", 1]})
+    assert is_valid is False
+
+
+def test_validate_script_params():
+    """Test script parameter validation."""
+    assert validate_script_params({"topic": "テスト"}) == (True, "")
+
+    is_valid, _ = validate_script_params({"topic": "テスト", "max_length": 10})
+    assert is_valid is False
+
+    is_valid, _ = validate_script_params(None)
+    assert is_valid is False
+
+
+def test_sanitize_filename():
+    """Test filename sanitization."""
+    assert sanitize_filename("../../etc/passwd") == "passwd"
+    assert sanitize_filename("my file.wav") == "my_file.wav"
+    assert sanitize_filename(".hidden") == "file_.hidden"
+
+
+def test_validate_model_file_extensions():
+    """Test that the double .model3.json extension is accepted and others are rejected."""
+    upload = FileStorage(stream=io.BytesIO(b"{}"), filename="Haru.Model3.json")
+    assert validate_model_file(upload) == (True, "")
+    assert validate_model_file(FileStorage(stream=io.BytesIO(b""), filename="m.zip")) == (True, "")
+
+    is_valid, error = validate_model_file(FileStorage(stream=io.BytesIO(b"{}"), filename="m.json"))
+    assert is_valid is False
+    assert "Invalid file extension: .json" in error
+
+
+def test_validate_model_file_size():
+    """Test the size limit and that an unknown content length is not rejected."""
+    too_large = FileStorage(
+        stream=io.BytesIO(b""), filename="m.zip", content_length=51 * 1024 * 1024
+    )
+    assert validate_model_file(too_large) == (False, "File too large. Maximum size is 50MB")
+
+    class ChunkedUpload:
+        filename = "m.zip"
+        content_length = None
+
+    assert validate_model_file(ChunkedUpload()) == (True, "")